@@ -6,11 +6,15 @@ Import this module in other scripts rather than calling the API directly.
 Backend is selected from config.json: "calendar_backend": "google" | "nextcloud"
 """
 
+import functools
 import json
 import os
 import re
 import sys
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
@@ -30,6 +34,8 @@ CONFIG_FILE = SKILL_DIR / "config.json"
 TOKEN_FILE = SKILL_DIR / "token.json"
 CREDS_FILE = SKILL_DIR / "credentials.json"
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
+GOOGLE_BATCH_SIZE = 50  # Google accepts up to 1000 calls per batch but recommends <= 50
+NEXTCLOUD_FETCH_WORKERS = 8  # CalDAV has no batch API; fetch this many calendars at once
 
 
 def load_config() -> dict:
@@ -39,32 +45,52 @@ def load_config() -> dict:
 
 # ─── Google Calendar Backend ───────────────────────────────────────────────────
 
-def _get_google_service():
+_google_creds = None
+_google_creds_lock = threading.Lock()
+
+
+def _get_google_credentials():
+    """Load, refresh or obtain OAuth credentials once for the whole process.
+
+    Locked so concurrent fetches (scan_calendar fans out per calendar) never
+    refresh the token, rewrite token.json or start the consent flow twice.
+    """
+    global _google_creds
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
 
-    creds = None
-    if TOKEN_FILE.exists():
-        creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-            except Exception:
-                creds = None  # force re-auth
+    with _google_creds_lock:
+        creds = _google_creds
+        if creds is not None and creds.valid:
+            return creds
+        if creds is None and TOKEN_FILE.exists():
+            creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
         if not creds or not creds.valid:
-            if not CREDS_FILE.exists():
-                raise FileNotFoundError(
-                    "credentials.json not found. Run setup.sh first.\n"
-                    "See SKILL.md Setup section for Google Cloud steps."
-                )
-            flow = InstalledAppFlow.from_client_secrets_file(str(CREDS_FILE), SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open(TOKEN_FILE, "w") as f:
-            f.write(creds.to_json())
-    return build("calendar", "v3", credentials=creds)
+            if creds and creds.expired and creds.refresh_token:
+                try:
+                    creds.refresh(Request())
+                except Exception:
+                    creds = None  # force re-auth
+            if not creds or not creds.valid:
+                if not CREDS_FILE.exists():
+                    raise FileNotFoundError(
+                        "credentials.json not found. Run setup.sh first.\n"
+                        "See SKILL.md Setup section for Google Cloud steps."
+                    )
+                flow = InstalledAppFlow.from_client_secrets_file(str(CREDS_FILE), SCOPES)
+                creds = flow.run_local_server(port=0)
+            with open(TOKEN_FILE, "w") as f:
+                f.write(creds.to_json())
+        _google_creds = creds
+        return creds
+
+
+def _get_google_service():
+    # One service per call: the HTTP transport underneath isn't thread-safe,
+    # but the credentials are shared.
+    from googleapiclient.discovery import build
+    return build("calendar", "v3", credentials=_get_google_credentials())
 
 
 def google_list_events(cal_id: str, time_min: datetime, time_max: datetime) -> list:
@@ -80,6 +106,35 @@ def google_list_events(cal_id: str, time_min: datetime, time_max: datetime) -> l
     return result.get("items", [])
 
 
+def google_batch_list_events(requests: list) -> list:
+    """List events for many (cal_id, time_min, time_max) triples via Google batch requests.
+
+    Returns one entry per triple, in order: the event list, or the exception
+    raised for that sub-request.
+    """
+    service = _get_google_service()
+    results = [None] * len(requests)
+
+    def _collect(request_id, response, exception):
+        i = int(request_id)
+        results[i] = exception if exception is not None else response.get("items", [])
+
+    for offset in range(0, len(requests), GOOGLE_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_collect)
+        chunk = requests[offset:offset + GOOGLE_BATCH_SIZE]
+        for i, (cal_id, time_min, time_max) in enumerate(chunk, offset):
+            batch.add(service.events().list(
+                calendarId=cal_id,
+                timeMin=time_min.isoformat(),
+                timeMax=time_max.isoformat(),
+                singleEvents=True,
+                orderBy="startTime",
+                maxResults=100,
+            ), request_id=str(i))
+        batch.execute()
+    return results
+
+
 def google_list_calendars() -> list:
     service = _get_google_service()
     return service.calendarList().list().execute().get("items", [])
@@ -334,6 +389,27 @@ class CalendarBackend:
             return nextcloud_list_events(self.config, cal_id, time_min, time_max)
         return google_list_events(cal_id, time_min, time_max)
 
+    def batch_list_events(self, requests: list) -> list:
+        """list_events for many (cal_id, time_min, time_max) triples.
+
+        Google sends them as batched HTTP requests; CalDAV has no batch API, so
+        Nextcloud fetches them concurrently on a small thread pool. Returns one
+        entry per triple, in order: the event list, or the exception raised for
+        that calendar.
+        """
+        if self.backend != "nextcloud":
+            return google_batch_list_events(requests)
+        if len(requests) <= 1:
+            return [self._list_events_or_error(r) for r in requests]
+        with ThreadPoolExecutor(max_workers=min(NEXTCLOUD_FETCH_WORKERS, len(requests))) as ex:
+            return list(ex.map(self._list_events_or_error, requests))
+
+    def _list_events_or_error(self, request: tuple):
+        try:
+            return self.list_events(*request)
+        except Exception as e:
+            return e
+
     def create_event(self, cal_id: str, title: str, start: datetime, end: datetime,
                      description: str = "") -> dict:
         self._assert_write_allowed(cal_id)
@@ -373,3 +449,29 @@ class CalendarBackend:
             if cal.get("summary", "").lower() == calendar_name.lower():
                 return cal["id"]
         return None
+
+
+# ─── Shared instances ─────────────────────────────────────────────────────────
+
+CALENDAR_LIST_TTL_SECONDS = 300
+_shared_backend = None
+
+
+def get_backend() -> CalendarBackend:
+    """Return the process-wide CalendarBackend, constructing it on first use."""
+    global _shared_backend
+    if _shared_backend is None:
+        _shared_backend = CalendarBackend()
+    return _shared_backend
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_calendars(backend, ttl_seconds: int, ttl_bucket: int) -> tuple:
+    return tuple(backend.list_user_calendars())
+
+
+def list_calendars_cached(backend=None, ttl_seconds: int = CALENDAR_LIST_TTL_SECONDS) -> tuple:
+    """backend.list_user_calendars() (default: get_backend()), reused for ttl_seconds."""
+    if backend is None:
+        backend = get_backend()
+    return _cached_calendars(backend, ttl_seconds, int(time.monotonic() // ttl_seconds))
@@ -11,11 +11,13 @@ Usage:
   python3 relationship_memory.py --brief "Sprint Review"  # people attending + context
   python3 relationship_memory.py --stale --days 30 # contacts not seen in N days
   python3 relationship_memory.py --top             # most frequent / highest-impact contacts
+  python3 relationship_memory.py --recompute       # rebuild contact aggregates from history
 """
 from __future__ import annotations  # PEP 563 — required for Python 3.8 compat with str|None hints
 
 import argparse
 import json
+import os
 import re
 import sqlite3
 import sys
@@ -59,24 +61,142 @@ CREATE TABLE IF NOT EXISTS contact_events (
 
 CREATE INDEX IF NOT EXISTS idx_ce_email ON contact_events(contact_email);
 CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email);
+CREATE INDEX IF NOT EXISTS idx_ce_email_dt ON contact_events(contact_email, event_datetime DESC);
+
+CREATE TABLE IF NOT EXISTS contact_ingest_state (
+    source TEXT PRIMARY KEY,
+    last_mtime_ns INTEGER DEFAULT 0
+);
+"""
+
+# Last object created by SCHEMA. get_db() skips schema setup when it exists,
+# so point this at any new table/index added above.
+SCHEMA_SENTINEL = "contact_ingest_state"
+
+# Full-text index over contact email/name, kept in sync by triggers. Created
+# separately from SCHEMA because FTS5 is an optional SQLite compile-time module.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+    email, name, content='contacts', content_rowid='id', tokenize='unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN
+    INSERT INTO contacts_fts(rowid, email, name) VALUES (new.id, new.email, new.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN
+    INSERT INTO contacts_fts(contacts_fts, rowid, email, name)
+    VALUES ('delete', old.id, old.email, old.name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE OF email, name ON contacts
+WHEN old.email IS NOT new.email OR old.name IS NOT new.name BEGIN
+    INSERT INTO contacts_fts(contacts_fts, rowid, email, name)
+    VALUES ('delete', old.id, old.email, old.name);
+    INSERT INTO contacts_fts(rowid, email, name) VALUES (new.id, new.email, new.name);
+END;
 """
 
 SENTIMENT_SCORE = {"positive": 1.0, "neutral": 0.0, "negative": -1.0}
 
+# Classify avg_sentiment inside SQLite so listings read the label straight off the row.
+SENTIMENT_LABEL_SQL = """
+    CASE WHEN avg_sentiment > 0.3 THEN 'positive'
+         WHEN avg_sentiment < -0.3 THEN 'negative'
+         ELSE 'neutral' END AS sentiment_label
+"""
+
+LOOKUP_LIMIT = 5
+
+# lookup_contact: matching contacts joined to their 10 most recent events in
+# one round trip. {matched} selects up to LOOKUP_LIMIT contacts plus their
+# display `pos`.
+_LOOKUP_SQL = """
+    WITH matched AS ({matched}), recent AS (
+        SELECT contact_email, event_title, event_datetime,
+               sentiment AS event_sentiment,
+               ROW_NUMBER() OVER (
+                   PARTITION BY contact_email ORDER BY event_datetime DESC
+               ) AS rn
+        FROM contact_events
+        WHERE contact_email IN (SELECT email FROM matched)
+    )
+    SELECT m.*, r.event_title, substr(r.event_datetime, 1, 10) AS event_date,
+           r.event_sentiment, r.rn
+    FROM matched m
+    LEFT JOIN recent r ON r.contact_email = m.email AND r.rn <= 10
+    ORDER BY m.pos, r.rn
+"""
+
+LOOKUP_FTS_SQL = _LOOKUP_SQL.format(matched=f"""
+    SELECT c.*, {SENTIMENT_LABEL_SQL}, ROW_NUMBER() OVER (ORDER BY f.rank) AS pos
+    FROM contacts_fts f JOIN contacts c ON c.id = f.rowid
+    WHERE contacts_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT {LOOKUP_LIMIT}
+""")
+
+LOOKUP_LIKE_SQL = _LOOKUP_SQL.format(matched=f"""
+    SELECT *, {SENTIMENT_LABEL_SQL},
+           ROW_NUMBER() OVER (ORDER BY interaction_count DESC, id) AS pos
+    FROM contacts
+    WHERE LOWER(email) LIKE ? OR LOWER(name) LIKE ?
+    ORDER BY interaction_count DESC, id
+    LIMIT {LOOKUP_LIMIT}
+""")
+
+_FTS_TOKEN_RE = re.compile(r"\w+")
+_DISPLAY_RE = re.compile(r"^(.+?)\s*<[^>]+>$")
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}")
+_ATTENDEE_SPLIT = re.compile(r"\s*,\s*")
+
 
 def get_db() -> sqlite3.Connection:
     conn = sqlite3.connect(str(DB_FILE))
     conn.row_factory = sqlite3.Row
-    conn.executescript(SCHEMA)
-    conn.commit()
+    # memory.db is shared with other scripts, so PRAGMA user_version can't be
+    # claimed here; probe for the newest SCHEMA object instead.
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?",
+                        (SCHEMA_SENTINEL,)).fetchone():
+        conn.executescript(SCHEMA)
+        _init_fts(conn)
+        conn.commit()
+    # journal_mode is persistent, but SQLite silently ignores a change made
+    # inside a transaction — so check what the file is actually using.
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    if mode != "wal":
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    # Per-connection tuning: with WAL, NORMAL only fsyncs at checkpoints.
+    if mode == "wal":
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB
     return conn
 
 
+def _init_fts(conn: sqlite3.Connection):
+    """Create contacts_fts and index existing contacts. No-op without FTS5."""
+    if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'contacts_fts'").fetchone():
+        return
+    try:
+        conn.executescript(FTS_SCHEMA)
+        conn.execute("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        pass  # SQLite built without FTS5 — lookup_contact falls back to LIKE
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 prefix query: 'alice sm' -> '"alice"* "sm"*'."""
+    return " ".join(f'"{tok}"*' for tok in _FTS_TOKEN_RE.findall(query.lower()))
+
+
 def _normalise_name(raw: str) -> str:
     """Extract display name from 'Name <email>' or return email prefix."""
-    m = re.match(r"^(.+?)\s*<[^>]+>$", raw.strip())
-    if m:
-        return m.group(1).strip().strip('"\'')
+    if "<" in raw:  # only the 'Name <email>' form needs the regex
+        m = _DISPLAY_RE.match(raw.strip())
+        if m:
+            return m.group(1).strip().strip('"\'')
     if "@" in raw:
         return raw.split("@")[0].replace(".", " ").replace("_", " ").title()
     return raw.strip()
@@ -84,15 +204,24 @@ def _normalise_name(raw: str) -> str:
 
 def _extract_email(raw: str) -> str | None:
     """Extract email address from a string."""
-    m = re.search(r"[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}", raw)
+    if "@" not in raw:
+        return None
+    m = _EMAIL_RE.search(raw)
     return m.group(0).lower() if m else None
 
 
 def upsert_contact(conn: sqlite3.Connection, email: str, name: str, event_dt: str,
-                   sentiment: str = "neutral", action_items_count: int = 0):
-    """Insert or update a contact record."""
+                   sentiment: str = "neutral", action_items_count: int = 0,
+                   now_iso: str | None = None, event_title: str = "") -> int:
+    """Insert or update a contact record and log the interaction.
+
+    Does not commit — callers batch many upserts into one transaction.
+    Bulk callers should also compute now_iso once per run and pass it in.
+    Returns the rowid of the new contact_events row.
+    """
     email = email.lower().strip()
-    now_iso = datetime.now(timezone.utc).isoformat()
+    if now_iso is None:
+        now_iso = datetime.now(timezone.utc).isoformat()
     score = SENTIMENT_SCORE.get(sentiment, 0.0)
 
     existing = conn.execute(
@@ -120,12 +249,12 @@ def upsert_contact(conn: sqlite3.Connection, email: str, name: str, event_dt: st
             VALUES (?, ?, ?, ?, 1, ?, ?, ?)
         """, (email, name, event_dt, event_dt, score, action_items_count, now_iso))
 
-    conn.execute("""
+    cur = conn.execute("""
         INSERT INTO contact_events
             (contact_email, event_title, event_datetime, sentiment, action_items_count)
         VALUES (?, ?, ?, ?, ?)
-    """, (email, "", event_dt, sentiment, action_items_count))
-    conn.commit()
+    """, (email, event_title, event_dt, sentiment, action_items_count))
+    return cur.lastrowid
 
 
 def ingest_from_outcomes(conn: sqlite3.Connection) -> dict:
@@ -133,15 +262,28 @@ def ingest_from_outcomes(conn: sqlite3.Connection) -> dict:
 
     The DB outcomes table does not store attendees or action_items columns —
     those live in the per-event JSON files written by capture_outcome.py.
+    Incremental: only files modified since the previous run are opened.
     """
     outcomes_dir = SKILL_DIR / "outcomes"
     if not outcomes_dir.exists():
         return {"status": "ok", "ingested": 0}
 
+    row = conn.execute(
+        "SELECT last_mtime_ns FROM contact_ingest_state WHERE source = 'outcomes'").fetchone()
+    watermark = row["last_mtime_ns"] if row else 0
+    # DirEntry.stat() is served from the directory scan — no per-file open
+    with os.scandir(outcomes_dir) as it:
+        fresh = sorted((entry.name, entry.path, entry.stat().st_mtime_ns) for entry in it
+                       if entry.name.endswith(".json") and entry.stat().st_mtime_ns > watermark)
+
     ingested = 0
-    for json_file in sorted(outcomes_dir.glob("*.json")):
+    newest = watermark
+    now_iso = datetime.now(timezone.utc).isoformat()
+    for _, path, mtime_ns in fresh:
+        newest = max(newest, mtime_ns)
         try:
-            data = json.loads(json_file.read_text())
+            with open(path, "rb") as f:
+                data = json.loads(f.read())
         except Exception:
             continue
 
@@ -154,7 +296,7 @@ def ingest_from_outcomes(conn: sqlite3.Connection) -> dict:
 
         # Attendees can be a JSON array of strings or dicts, or a comma-separated string
         if isinstance(attendees_raw, str):
-            attendee_list = [a.strip() for a in attendees_raw.split(",") if a.strip()]
+            attendee_list = [a for a in _ATTENDEE_SPLIT.split(attendees_raw.strip()) if a]
         else:
             attendee_list = attendees_raw  # already a list
 
@@ -167,47 +309,42 @@ def ingest_from_outcomes(conn: sqlite3.Connection) -> dict:
                 name = _normalise_name(str(raw_attendee))
             if not email:
                 continue
-            upsert_contact(conn, email, name, event_dt, sentiment, ai_count)
-            # Back-fill event_title on the row just inserted (rowid-based, no ORDER BY needed)
-            last_id = conn.execute(
-                "SELECT MAX(id) FROM contact_events WHERE contact_email = ? AND event_datetime = ? AND event_title = ''",
-                (email.lower().strip(), event_dt)
-            ).fetchone()[0]
-            if last_id is not None:
-                conn.execute(
-                    "UPDATE contact_events SET event_title = ? WHERE id = ?",
-                    (event_title, last_id)
-                )
-            conn.commit()
+            upsert_contact(conn, email, name, event_dt, sentiment, ai_count, now_iso,
+                           event_title=event_title)
             ingested += 1
 
+    conn.execute("INSERT OR REPLACE INTO contact_ingest_state (source, last_mtime_ns) "
+                 "VALUES ('outcomes', ?)", (newest,))
+    conn.commit()  # one transaction (and one fsync) for the whole run
     return {"status": "ok", "ingested": ingested}
 
 
 def ingest_from_calendar(conn: sqlite3.Connection) -> dict:
     """Pull attendees from upcoming calendar events via cal_backend."""
     try:
-        from cal_backend import CalendarBackend
-        backend = CalendarBackend()
+        from cal_backend import get_backend, list_calendars_cached
+        backend = get_backend()
         now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
         end = now + timedelta(days=30)
-        calendars = backend.list_user_calendars()
+        calendars = list_calendars_cached(backend)
         ingested = 0
-        for cal in calendars:
-            try:
-                events = backend.list_events(cal["id"], now, end)
-                for e in events:
-                    attendees = e.get("attendees") or []
-                    event_dt = (e.get("start") or {}).get("dateTime", "")
-                    for a in attendees:
-                        email = a.get("email", "")
-                        if not email or "resource.calendar.google.com" in email:
-                            continue
-                        name = a.get("displayName") or _normalise_name(email)
-                        upsert_contact(conn, email, name, event_dt, "neutral", 0)
-                        ingested += 1
-            except Exception:
-                continue
+        with conn:  # single commit for every calendar; rolled back if the loop raises
+            for cal in calendars:
+                try:
+                    events = backend.list_events(cal["id"], now, end)
+                    for e in events:
+                        attendees = e.get("attendees") or []
+                        event_dt = (e.get("start") or {}).get("dateTime", "")
+                        for a in attendees:
+                            email = a.get("email", "")
+                            if not email or "resource.calendar.google.com" in email:
+                                continue
+                            name = a.get("displayName") or _normalise_name(email)
+                            upsert_contact(conn, email, name, event_dt, "neutral", 0, now_iso)
+                            ingested += 1
+                except Exception:
+                    continue
         return {"status": "ok", "ingested": ingested}
     except Exception as e:
         return {"status": "error", "message": str(e), "ingested": 0}
@@ -215,72 +352,65 @@ def ingest_from_calendar(conn: sqlite3.Connection) -> dict:
 
 def lookup_contact(conn: sqlite3.Connection, query: str) -> dict:
     """Find a contact by name or email and return interaction history."""
-    query_lower = f"%{query.lower()}%"
-    rows = conn.execute("""
-        SELECT * FROM contacts
-        WHERE LOWER(email) LIKE ? OR LOWER(name) LIKE ?
-        ORDER BY interaction_count DESC
-        LIMIT 5
-    """, (query_lower, query_lower)).fetchall()
+    rows = []
+    fts_query = _fts_query(query)
+    if fts_query:
+        try:
+            rows = conn.execute(LOOKUP_FTS_SQL, (fts_query,)).fetchall()
+        except sqlite3.OperationalError:
+            rows = []  # no FTS5 index on this database
+    found = {row["email"] for row in rows}
+    if len(found) < LOOKUP_LIMIT:
+        # Top up with substring matches: mid-word fragments FTS can't see
+        # ('smith' in 'Goldsmith') and databases without FTS5
+        query_lower = f"%{query.lower()}%"
+        rows += [row for row in conn.execute(LOOKUP_LIKE_SQL, (query_lower, query_lower))
+                 if row["email"] not in found]
 
     if not rows:
         return {"status": "not_found", "query": query}
 
-    results = []
+    by_email: dict = {}
     for row in rows:
         email = row["email"]
-        events = conn.execute("""
-            SELECT event_title, event_datetime, sentiment, action_items_count
-            FROM contact_events
-            WHERE contact_email = ?
-            ORDER BY event_datetime DESC
-            LIMIT 10
-        """, (email,)).fetchall()
-
-        # Sentiment label
-        avg = row["avg_sentiment"]
-        if avg > 0.3:
-            sentiment_label = "positive"
-        elif avg < -0.3:
-            sentiment_label = "negative"
-        else:
-            sentiment_label = "neutral"
-
-        results.append({
-            "email": email,
-            "name": row["name"],
-            "first_seen": row["first_seen"],
-            "last_seen": row["last_seen"],
-            "interaction_count": row["interaction_count"],
-            "avg_sentiment": row["avg_sentiment"],
-            "sentiment_label": sentiment_label,
-            "total_action_items": row["total_action_items"],
-            "notes": row["notes"],
-            "tags": row["tags"],
-            "recent_events": [
-                {
-                    "title": e["event_title"],
-                    "date": e["event_datetime"][:10] if e["event_datetime"] else "",
-                    "sentiment": e["sentiment"],
-                }
-                for e in events
-            ],
-        })
-
-    return {"status": "ok", "results": results}
+        contact = by_email.get(email)
+        if contact is None:
+            if len(by_email) >= LOOKUP_LIMIT:
+                continue
+            contact = by_email[email] = {
+                "email": email,
+                "name": row["name"],
+                "first_seen": row["first_seen"],
+                "last_seen": row["last_seen"],
+                "interaction_count": row["interaction_count"],
+                "avg_sentiment": row["avg_sentiment"],
+                "sentiment_label": row["sentiment_label"],
+                "total_action_items": row["total_action_items"],
+                "notes": row["notes"],
+                "tags": row["tags"],
+                "recent_events": [],
+            }
+        if row["rn"] is not None:
+            contact["recent_events"].append({
+                "title": row["event_title"],
+                "date": row["event_date"] or "",
+                "sentiment": row["event_sentiment"],
+            })
+
+    return {"status": "ok", "results": list(by_email.values())}
 
 
 def brief_for_event(conn: sqlite3.Connection, event_title: str, days_ahead: int = 7) -> dict:
     """
     Return a contextual brief on attendees for an upcoming event.
-    Looks up each attendee in contact history.
+    Looks up every attendee in contact history with a single query.
     """
     try:
-        from cal_backend import CalendarBackend
-        backend = CalendarBackend()
+        from cal_backend import get_backend, list_calendars_cached
+        backend = get_backend()
         now = datetime.now(timezone.utc)
         end = now + timedelta(days=days_ahead)
-        calendars = backend.list_user_calendars()
+        calendars = list_calendars_cached(backend)
 
         target_event = None
         for cal in calendars:
@@ -298,15 +428,23 @@ def brief_for_event(conn: sqlite3.Connection, event_title: str, days_ahead: int
         if not target_event:
             return {"status": "not_found", "message": f"No upcoming event matching '{event_title}'"}
 
-        attendees = target_event.get("attendees") or []
+        attendees = [a for a in (target_event.get("attendees") or [])
+                     if a.get("email") and "resource.calendar.google.com" not in a["email"]]
+        # One IN query for every attendee instead of a lookup_contact() per person
+        emails = [a["email"].lower().strip() for a in attendees]
+        known = {}
+        if emails:
+            placeholders = ",".join("?" * len(emails))
+            known = {row["email"]: row for row in conn.execute(f"""
+                SELECT *, {SENTIMENT_LABEL_SQL}, substr(last_seen, 1, 10) AS last_seen_date
+                FROM contacts WHERE email IN ({placeholders})
+            """, emails)}
+
         briefs = []
-        for a in attendees:
-            email = a.get("email", "")
-            if not email or "resource.calendar.google.com" in email:
-                continue
-            result = lookup_contact(conn, email)
-            if result.get("status") == "ok" and result["results"]:
-                c = result["results"][0]
+        for a, key in zip(attendees, emails):
+            email = a["email"]
+            c = known.get(key)
+            if c is not None:
                 tip = ""
                 if c["interaction_count"] == 0:
                     tip = "First time meeting."
@@ -321,7 +459,7 @@ def brief_for_event(conn: sqlite3.Connection, event_title: str, days_ahead: int
                     "email": email,
                     "interactions": c["interaction_count"],
                     "sentiment": c["sentiment_label"],
-                    "last_seen": c["last_seen"][:10] if c["last_seen"] else "never",
+                    "last_seen": c["last_seen_date"] or "never",
                     "tip": tip.strip(),
                 })
             else:
@@ -348,29 +486,25 @@ def brief_for_event(conn: sqlite3.Connection, event_title: str, days_ahead: int
 
 def find_stale_contacts(conn: sqlite3.Connection, days: int = 30) -> dict:
     """Return contacts not seen in the last N days."""
-    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    now_dt = datetime.now(timezone.utc)
+    cutoff = (now_dt - timedelta(days=days)).isoformat()
+    # julianday() parses the ISO timestamps in C; NULL for unparseable values.
     rows = conn.execute("""
-        SELECT * FROM contacts
+        SELECT *, substr(last_seen, 1, 10) AS last_seen_date,
+               CAST(julianday(?) - julianday(NULLIF(last_seen, '')) AS INTEGER) AS days_since
+        FROM contacts
         WHERE last_seen < ? AND interaction_count > 0
         ORDER BY last_seen ASC
         LIMIT 20
-    """, (cutoff,)).fetchall()
+    """, (now_dt.isoformat(), cutoff)).fetchall()
 
     results = []
     for row in rows:
-        days_ago = ""
-        if row["last_seen"]:
-            try:
-                last = datetime.fromisoformat(row["last_seen"].replace("Z", "+00:00"))
-                if last.tzinfo is None:
-                    last = last.replace(tzinfo=timezone.utc)
-                days_ago = str((datetime.now(timezone.utc) - last).days)
-            except Exception:
-                pass
+        days_ago = "" if row["days_since"] is None else str(row["days_since"])
         results.append({
             "name": row["name"] or row["email"],
             "email": row["email"],
-            "last_seen": row["last_seen"][:10] if row["last_seen"] else "",
+            "last_seen": row["last_seen_date"] or "",
             "days_since": days_ago,
             "interaction_count": row["interaction_count"],
         })
@@ -380,23 +514,22 @@ def find_stale_contacts(conn: sqlite3.Connection, days: int = 30) -> dict:
 
 def top_contacts(conn: sqlite3.Connection, limit: int = 10) -> dict:
     """Return most frequent and highest-impact contacts."""
-    rows = conn.execute("""
-        SELECT * FROM contacts
+    rows = conn.execute(f"""
+        SELECT *, {SENTIMENT_LABEL_SQL}, substr(last_seen, 1, 10) AS last_seen_date
+        FROM contacts
         ORDER BY interaction_count DESC, avg_sentiment DESC
         LIMIT ?
     """, (limit,)).fetchall()
 
     results = []
     for row in rows:
-        avg = row["avg_sentiment"]
-        sentiment_label = "positive" if avg > 0.3 else ("negative" if avg < -0.3 else "neutral")
         results.append({
             "name": row["name"] or row["email"],
             "email": row["email"],
             "interactions": row["interaction_count"],
             "avg_sentiment": row["avg_sentiment"],
-            "sentiment_label": sentiment_label,
-            "last_seen": row["last_seen"][:10] if row["last_seen"] else "",
+            "sentiment_label": row["sentiment_label"],
+            "last_seen": row["last_seen_date"] or "",
             "total_action_items": row["total_action_items"],
         })
 
@@ -404,6 +537,36 @@ def top_contacts(conn: sqlite3.Connection, limit: int = 10) -> dict:
         "SELECT COUNT(*) FROM contacts").fetchone()[0]}
 
 
+def recompute_aggregates(conn: sqlite3.Connection) -> dict:
+    """Rebuild interaction_count, avg_sentiment and total_action_items from contact_events.
+
+    The reduction runs as one GROUP BY inside SQLite; Python only ships the
+    per-contact results back in a single executemany.
+    """
+    rows = conn.execute("""
+        SELECT contact_email,
+               COUNT(*) AS n,
+               AVG(CASE sentiment WHEN 'positive' THEN 1.0
+                                  WHEN 'negative' THEN -1.0
+                                  ELSE 0.0 END) AS avg_score,
+               COALESCE(SUM(action_items_count), 0) AS items
+        FROM contact_events
+        GROUP BY contact_email
+    """).fetchall()
+    now_iso = datetime.now(timezone.utc).isoformat()
+    with conn:
+        conn.executemany("""
+            UPDATE contacts SET
+                interaction_count = ?,
+                avg_sentiment = ?,
+                total_action_items = ?,
+                updated_at = ?
+            WHERE email = ?
+        """, [(r["n"], round(r["avg_score"], 3), r["items"], now_iso, r["contact_email"])
+              for r in rows])
+    return {"status": "ok", "contacts_recomputed": len(rows)}
+
+
 def add_note(conn: sqlite3.Connection, email: str, note: str) -> dict:
     """Append a manual note to a contact."""
     email = email.lower().strip()
@@ -433,6 +596,8 @@ def main():
                         help="Days threshold for --stale (default 30)")
     parser.add_argument("--top", action="store_true",
                         help="Top contacts by frequency and impact")
+    parser.add_argument("--recompute", action="store_true",
+                        help="Rebuild contact aggregates from stored interactions")
     parser.add_argument("--add-note", nargs=2, metavar=("EMAIL", "NOTE"),
                         help="Add a manual note to a contact")
     args = parser.parse_args()
@@ -455,6 +620,8 @@ def main():
         print(json.dumps(find_stale_contacts(conn, args.days), indent=2))
     elif args.top:
         print(json.dumps(top_contacts(conn), indent=2))
+    elif args.recompute:
+        print(json.dumps(recompute_aggregates(conn), indent=2))
     elif args.add_note:
         print(json.dumps(add_note(conn, args.add_note[0], args.add_note[1]), indent=2))
     else:
@@ -18,6 +18,7 @@ import json
 import re
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 if sys.version_info < (3, 8):
     print(json.dumps({"error": "python_version_too_old", "detail": f"Python 3.8+ required."}))
@@ -28,107 +29,160 @@ sys.path.insert(0, str(SKILL_DIR / "scripts"))
 
 
 # ─── Rule Patterns ────────────────────────────────────────────────────────────
-# Each pattern: (regex, parser_fn) → returns rule_json dict or None
+# Each pattern: (regex, template, fields, anchors).
+#   template — read-only rule_json skeleton; its "description" is a format string
+#              where {0} is the whole match and {1}, {2}… are the capture groups.
+#   fields   — (section, key, group, convert) entries filled from the match,
+#              e.g. ("condition", "title_contains", 1, str.lower).
+#   anchors  — literal keywords of which at least one must occur for the regex
+#              to match; parse_rule only runs the regexes whose anchors appear.
+
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_WORD_RE = re.compile(r"word[s]?\s+(\w+)", re.I)
+_PREP_NOUN_RE = re.compile(r"(?:about|for|with)\s+(\w+)", re.I)
+_DAYS_RE = re.compile(r"(\d+)\s*day", re.I)
+_HOURS_RE = re.compile(r"(\d+)\s*hour", re.I)
+
 
 def _extract_keyword(text: str) -> str:
     """Extract quoted or last noun phrase."""
-    m = re.search(r'"([^"]+)"', text)
+    m = _QUOTED_RE.search(text)
     if m:
         return m.group(1).lower()
-    m = re.search(r"word[s]?\s+(\w+)", text, re.I)
+    m = _WORD_RE.search(text)
     if m:
         return m.group(1).lower()
-    m = re.search(r"(?:about|for|with)\s+(\w+)", text, re.I)
+    m = _PREP_NOUN_RE.search(text)
     if m:
         return m.group(1).lower()
     return ""
 
 
 def _extract_days(text: str) -> int:
-    m = re.search(r"(\d+)\s*day", text, re.I)
+    m = _DAYS_RE.search(text)
     return int(m.group(1)) if m else 1
 
 
 def _extract_hours(text: str) -> int:
-    m = re.search(r"(\d+)\s*hour", text, re.I)
+    m = _HOURS_RE.search(text)
     return int(m.group(1)) if m else 1
 
 
+def _template(condition: dict, action: dict, description: str) -> MappingProxyType:
+    """Freeze a rule_json skeleton; _apply_template copies it per match.
+
+    List values are written as tuples so no rule can share them with the template.
+    """
+    return MappingProxyType({"condition": condition, "action": action,
+                             "description": description})
+
+
 RULE_PATTERNS = [
     # "Never bother me about standups" / "Suppress standup"
     (r"(?:never|suppress|ignore|skip|don.?t|do not)\s+(?:bother|ask|remind|notify|check).+(?:about|for)?\s+(\w+)",
-     lambda m, text: {
-         "condition": {"title_contains": m.group(1).lower()},
-         "action": {"suppress": True},
-         "description": f"Suppress all check-ins for events matching '{m.group(1)}'",
-     }),
+     _template({"title_contains": ""}, {"suppress": True},
+               "Suppress all check-ins for events matching '{1}'"),
+     (("condition", "title_contains", 1, str.lower),),
+     ("bother", "ask", "remind", "notify", "check")),
 
     # "Always prep me N days before anything with the word X"
     (r"always\s+prep\s+(?:me\s+)?(\d+)\s+day[s]?\s+before\s+.+?(?:word\s+)?[\"']?(\w+)[\"']?",
-     lambda m, text: {
-         "condition": {"title_contains": m.group(2).lower()},
-         "action": {"set_score": 9, "pre_checkin_offset": f"{m.group(1)} days"},
-         "description": f"Always prep {m.group(1)} days before '{m.group(2)}' events",
-     }),
+     _template({"title_contains": ""}, {"set_score": 9, "pre_checkin_offset": ""},
+               "Always prep {1} days before '{2}' events"),
+     (("condition", "title_contains", 2, str.lower),
+      ("action", "pre_checkin_offset", 1, "{} days".format)),
+     ("prep",)),
 
     # "Never bother me on Saturdays / Sundays / weekends"
     (r"(?:never|don.?t|do not)\s+(?:bother|notify|remind|ask).+(?:saturday|sunday|weekend)",
-     lambda m, text: {
-         "condition": {"day_of_week": ["Saturday", "Sunday"]},
-         "action": {"suppress": True},
-         "description": "Suppress all check-ins on weekends",
-     }),
+     _template({"day_of_week": ("Saturday", "Sunday")}, {"suppress": True},
+               "Suppress all check-ins on weekends"),
+     (),
+     ("saturday", "sunday", "weekend")),
 
     # "Suppress all events on Saturdays"
     (r"suppress\s+.+(?:saturday|sunday|weekend)",
-     lambda m, text: {
-         "condition": {"day_of_week": ["Saturday", "Sunday"]},
-         "action": {"suppress": True},
-         "description": "Suppress all check-ins on weekends",
-     }),
+     _template({"day_of_week": ("Saturday", "Sunday")}, {"suppress": True},
+               "Suppress all check-ins on weekends"),
+     (),
+     ("suppress",)),
 
     # "Always remind me N hours before X"
     (r"always\s+remind\s+(?:me\s+)?(\d+)\s+hour[s]?\s+before\s+.+?(?:word\s+)?[\"']?(\w+)[\"']?",
-     lambda m, text: {
-         "condition": {"title_contains": m.group(2).lower()},
-         "action": {"set_score": 8, "pre_checkin_offset": f"{m.group(1)} hours"},
-         "description": f"Always remind {m.group(1)} hours before '{m.group(2)}' events",
-     }),
+     _template({"title_contains": ""}, {"set_score": 8, "pre_checkin_offset": ""},
+               "Always remind {1} hours before '{2}' events"),
+     (("condition", "title_contains", 2, str.lower),
+      ("action", "pre_checkin_offset", 1, "{} hours".format)),
+     ("remind",)),
 
     # "Boost / raise score for X"
     (r"(?:boost|raise|increase)\s+(?:score|priority)\s+for\s+.+?(?:word\s+)?[\"']?(\w+)[\"']?",
-     lambda m, text: {
-         "condition": {"title_contains": m.group(1).lower()},
-         "action": {"add_score": 3},
-         "description": f"Raise score by 3 for events matching '{m.group(1)}'",
-     }),
+     _template({"title_contains": ""}, {"add_score": 3},
+               "Raise score by 3 for events matching '{1}'"),
+     (("condition", "title_contains", 1, str.lower),),
+     ("boost", "raise", "increase")),
 
     # "Lower / reduce score for X"
     (r"(?:lower|reduce|decrease)\s+(?:score|priority)\s+for\s+.+?(?:word\s+)?[\"']?(\w+)[\"']?",
-     lambda m, text: {
-         "condition": {"title_contains": m.group(1).lower()},
-         "action": {"add_score": -3},
-         "description": f"Lower score by 3 for events matching '{m.group(1)}'",
-     }),
+     _template({"title_contains": ""}, {"add_score": -3},
+               "Lower score by 3 for events matching '{1}'"),
+     (("condition", "title_contains", 1, str.lower),),
+     ("lower", "reduce", "decrease")),
 
     # "Only check in every N occurrences for X"
     (r"(?:only|just)\s+check.?in\s+every\s+(\d+)\s+(?:time|occurrence|instance).+?(?:word\s+)?[\"']?(\w+)[\"']?",
-     lambda m, text: {
-         "condition": {"title_contains": m.group(2).lower(), "recurring_only": True},
-         "action": {"check_in_every_n": int(m.group(1))},
-         "description": f"Check in every {m.group(1)} occurrences of '{m.group(2)}'",
-     }),
+     _template({"title_contains": "", "recurring_only": True}, {"check_in_every_n": 0},
+               "Check in every {1} occurrences of '{2}'"),
+     (("condition", "title_contains", 2, str.lower),
+      ("action", "check_in_every_n", 1, int)),
+     ("check",)),
 ]
 
 
+_COMPILED_RULES = [(re.compile(pattern), template, fields)
+                   for pattern, template, fields, _ in RULE_PATTERNS]
+
+
+def _copy_section(section: dict) -> dict:
+    return {key: list(value) if isinstance(value, tuple) else value
+            for key, value in section.items()}
+
+
+def _apply_template(m, template: MappingProxyType, fields: tuple) -> dict:
+    """Build rule_json from a template: copy its sections, then fill in match groups."""
+    rule = {"condition": _copy_section(template["condition"]),
+            "action": _copy_section(template["action"])}
+    for section, key, group, convert in fields:
+        rule[section][key] = convert(m.group(group))
+    rule["description"] = template["description"].format(m.group(0), *m.groups())
+    return rule
+
+
+def _index_anchors(patterns: list) -> dict:
+    """Map each anchor keyword to the indexes of the patterns it can unlock."""
+    by_anchor = {}
+    for i, (_, _, _, anchors) in enumerate(patterns):
+        for anchor in anchors:
+            by_anchor.setdefault(anchor, []).append(i)
+    return by_anchor
+
+
+_RULES_BY_ANCHOR = _index_anchors(RULE_PATTERNS)
+
+# Zero-width lookahead so overlapping anchors are all reported in one pass.
+_ANCHOR_RE = re.compile("(?=(" + "|".join(map(re.escape, _RULES_BY_ANCHOR)) + "))")
+
+
 def parse_rule(text: str) -> dict:
-    """Try each pattern in order. Return first match as rule_json."""
+    """Try each candidate pattern in order. Return first match as rule_json."""
     text_lower = text.lower().strip()
-    for pattern, parser in RULE_PATTERNS:
-        m = re.search(pattern, text_lower)
+    candidates = {i for a in _ANCHOR_RE.findall(text_lower) for i in _RULES_BY_ANCHOR[a]}
+    for i in sorted(candidates):
+        pattern, template, fields = _COMPILED_RULES[i]
+        m = pattern.search(text_lower)
         if m:
             try:
-                rule_json = parser(m, text_lower)
+                rule_json = _apply_template(m, template, fields)
                 if rule_json:
                     rule_json["source_text"] = text
                     return {"parsed": True, "rule_json": rule_json,
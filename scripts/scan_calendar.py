@@ -11,8 +11,13 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Python version guard — must be first executable code
 if sys.version_info < (3, 8):
@@ -24,13 +29,39 @@ if sys.version_info < (3, 8):
     sys.exit(1)
 
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _loads = json.loads
+
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+def _dumps(obj) -> str:
+    return _dumps_bytes(obj).decode()
+
 
 SKILL_DIR = Path.home() / ".openclaw/workspace/skills/proactive-claw"
 CONFIG_FILE = SKILL_DIR / "config.json"
 OUTCOMES_DIR = SKILL_DIR / "outcomes"
 CACHE_FILE = SKILL_DIR / "last_scan.json"
 SNOOZE_FILE = SKILL_DIR / "snoozed.json"
+MAX_FETCH_WORKERS = 16
+CALENDAR_LIST_TTL_SECONDS = 60
+RECENT_OUTCOMES = 5  # newest outcomes kept per recurring_id (--patterns shows 5, scoring uses 4)
 
 HIGH_STAKES_KEYWORDS = {
     "demo", "presentation", "interview", "workshop", "conference",
@@ -39,19 +70,37 @@ HIGH_STAKES_KEYWORDS = {
 }
 ROUTINE_KEYWORDS = {"standup", "stand-up", "sync", "check-in", "scrum", "huddle"}
 
+# Plain substring alternations, so matching is the same as `kw in title`
+_HIGH_STAKES_RE = re.compile("|".join(map(re.escape, sorted(HIGH_STAKES_KEYWORDS))))
+_ROUTINE_RE = re.compile("|".join(map(re.escape, sorted(ROUTINE_KEYWORDS))))
+
 
 def load_config() -> dict:
     with open(CONFIG_FILE) as f:
         return json.load(f)
 
 
+def _outcome_entries() -> list:
+    """*.json entries of the outcomes directory, sorted by filename."""
+    try:
+        with os.scandir(OUTCOMES_DIR) as it:
+            entries = [e for e in it if e.name.endswith(".json")]
+    except OSError:
+        return []
+    entries.sort(key=attrgetter("name"))
+    return entries
+
+
+def _read_json(path: str):
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
 def load_outcomes(recurring_id=None) -> list:
     outcomes = []
-    if not OUTCOMES_DIR.exists():
-        return outcomes
-    for f in sorted(OUTCOMES_DIR.glob("*.json")):
+    for entry in _outcome_entries():
         try:
-            data = json.loads(f.read_text())
+            data = _read_json(entry.path)
             if recurring_id is None or data.get("recurring_id") == recurring_id:
                 outcomes.append(data)
         except Exception:
@@ -59,42 +108,102 @@ def load_outcomes(recurring_id=None) -> list:
     return outcomes
 
 
+def _outcomes_signature():
+    """(dir mtime, newest file mtime) — changes whenever an outcome is added or rewritten."""
+    try:
+        dir_mtime_ns = OUTCOMES_DIR.stat().st_mtime_ns
+    except OSError:
+        return None
+    newest_ns = 0
+    for entry in _outcome_entries():
+        try:
+            newest_ns = max(newest_ns, entry.stat().st_mtime_ns)
+        except OSError:
+            pass
+    return (dir_mtime_ns, newest_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _outcomes_index(signature) -> tuple:
+    recent = {}
+    totals = {}
+    if signature is None:
+        return recent, totals
+    for entry in _outcome_entries():
+        try:
+            data = _read_json(entry.path)
+            rid = data.get("recurring_id", "")
+        except Exception:
+            continue
+        totals[rid] = totals.get(rid, 0) + 1
+        bucket = recent.setdefault(rid, [])
+        bucket.append(data)
+        if len(bucket) > RECENT_OUTCOMES:
+            del bucket[0]
+    return recent, totals
+
+
+def load_all_outcomes_indexed() -> dict:
+    """Read every outcome file once and group the records by recurring_id.
+
+    Files are visited in filename order, so each list is oldest-to-newest
+    like load_outcomes(), but only the newest RECENT_OUTCOMES records are
+    kept; outcome_totals() has the full counts. The index is cached per
+    outcomes-directory signature, so repeat calls in one process skip the
+    disk until an outcome is added or rewritten. Treat it as read-only.
+    """
+    return _outcomes_index(_outcomes_signature())[0]
+
+
+def outcome_totals() -> dict:
+    """Number of outcome records per recurring_id (same cache as the index)."""
+    return _outcomes_index(_outcomes_signature())[1]
+
+
+@functools.lru_cache(maxsize=256)
+def _snooze_expiry(until: str):
+    """UTC-aware expiry for a snooze 'until' string, or None if malformed."""
+    try:
+        until_dt = datetime.fromisoformat(until)
+    except (TypeError, ValueError):
+        return None
+    if until_dt.tzinfo is None:
+        until_dt = until_dt.replace(tzinfo=timezone.utc)
+    return until_dt
+
+
+def _snooze_active(until, now: datetime) -> bool:
+    if not until or not isinstance(until, str):
+        return False
+    until_dt = _snooze_expiry(until)
+    return until_dt is not None and now < until_dt
+
+
 def load_snoozed() -> dict:
     """Load snoozed entries, auto-purging expired (non-dismissed) ones."""
     if not SNOOZE_FILE.exists():
         return {}
     try:
-        data = json.loads(SNOOZE_FILE.read_text())
+        data = _loads(SNOOZE_FILE.read_bytes())
     except Exception:
         return {}
     now = datetime.now(timezone.utc)
-    cleaned = {}
-    for event_id, entry in data.items():
-        if entry.get("dismissed"):
-            cleaned[event_id] = entry  # dismissed = keep forever
-            continue
-        until = entry.get("until")
-        if until:
-            try:
-                until_dt = datetime.fromisoformat(until)
-                if until_dt.tzinfo is None:
-                    until_dt = until_dt.replace(tzinfo=timezone.utc)
-                if now < until_dt:
-                    cleaned[event_id] = entry  # still active snooze
-                # else: expired — drop it
-            except Exception:
-                pass  # malformed entry — drop it
+    # Dismissed = keep forever; snoozed = keep until expiry; malformed = drop
+    cleaned = {
+        event_id: entry for event_id, entry in data.items()
+        if entry.get("dismissed") or _snooze_active(entry.get("until"), now)
+    }
     if len(cleaned) != len(data):
         # Write back cleaned version
         try:
-            SNOOZE_FILE.write_text(json.dumps(cleaned, indent=2))
+            SNOOZE_FILE.write_text(_dumps(cleaned))
         except Exception:
             pass
     return cleaned
 
 
 def save_snoozed(snoozed: dict):
-    SNOOZE_FILE.write_text(json.dumps(snoozed, indent=2))
+    SNOOZE_FILE.write_text(_dumps(snoozed))
 
 
 def is_snoozed(event_id: str, snoozed: dict) -> bool:
@@ -103,16 +212,7 @@ def is_snoozed(event_id: str, snoozed: dict) -> bool:
         return False
     if entry.get("dismissed"):
         return True
-    until = entry.get("until")
-    if until:
-        try:
-            until_dt = datetime.fromisoformat(until)
-            if datetime.now(timezone.utc) < until_dt:
-                return True
-            # Snooze expired — remove it
-        except Exception:
-            pass
-    return False
+    return _snooze_active(entry.get("until"), datetime.now(timezone.utc))
 
 
 def get_user_timezone(config: dict) -> str:
@@ -127,78 +227,112 @@ def to_utc(dt_str: str) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
-def score_event(event: dict, config: dict, outcomes: list, openclaw_event_titles: list,
-                snoozed: dict) -> dict:
-    score = 0
-    title = (event.get("summary") or "").lower()
-    description = event.get("description") or ""
+def build_checkin_index(openclaw_event_titles: list) -> str:
+    """Join lowercased OpenClaw titles into one NUL-separated string.
+
+    `slug in index` gives the same answer as testing each title in turn, but
+    in a single scan. An empty string means there are no OpenClaw events.
+    """
+    if not openclaw_event_titles:
+        return ""
+    return "\x00" + "\x00".join(openclaw_event_titles)
+
+
+class ScoringCtx(NamedTuple):
+    """Per-scan invariants, computed once and shared by every score_event() call."""
+    user_domain: str
+    checkin_index: str
+    calendar_threshold: int
+    now: datetime
+    outcomes_by_rid: dict
+    totals_by_rid: dict
+
+
+def build_scoring_ctx(config: dict, openclaw_event_titles: list, now: datetime = None) -> ScoringCtx:
+    user_email = config.get("user_email", "")
+    return ScoringCtx(
+        user_domain=user_email.split("@")[-1] if "@" in user_email else "",
+        checkin_index=build_checkin_index(openclaw_event_titles),
+        calendar_threshold=config.get("calendar_threshold", 6),
+        now=now or datetime.now(timezone.utc),
+        outcomes_by_rid=load_all_outcomes_indexed(),
+        totals_by_rid=outcome_totals(),
+    )
+
+
+def score_event(event: dict, ctx: ScoringCtx, snoozed: dict) -> dict:
     attendees = event.get("attendees") or []
+    self_att = next((att for att in attendees if att.get("self")), None)
+
+    # Declined events — skip entirely, before doing any parsing
+    if self_att is not None and self_att.get("responseStatus") == "declined":
+        return None
+
+    score = 0
+    summary = event.get("summary")
+    title = (summary or "").lower()
+    has_description = bool((event.get("description") or "").strip())
     recurring_id = event.get("recurringEventId") or event.get("recurring_id") or ""
+    outcomes = ctx.outcomes_by_rid.get(recurring_id, []) if recurring_id else []
     event_id = event.get("id", "")
 
     # All-day event — lower relevance
-    start_raw = event["start"].get("dateTime") or event["start"].get("date", "")
-    end_raw = event["end"].get("dateTime") or event["end"].get("date", "")
+    start, end = event["start"], event["end"]
+    start_raw = start.get("dateTime") or start.get("date", "")
+    end_raw = end.get("dateTime") or end.get("date", "")
     is_all_day = "T" not in start_raw
 
     if is_all_day:
         score -= 1
 
-    # Duration
-    try:
-        s = to_utc(start_raw) if not is_all_day else None
-        e = to_utc(end_raw) if not is_all_day else None
-        duration_min = int((e - s).total_seconds() // 60) if s and e else 0
-        if duration_min > 60:
-            score += 2
-    except Exception:
-        duration_min = 0
-
-    # Declined events — skip entirely
-    for att in attendees:
-        if att.get("self") and att.get("responseStatus") == "declined":
-            return None
+    # Duration (start is parsed once and reused for timing below)
+    start_dt = None
+    duration_min = 0
+    if not is_all_day:
+        try:
+            start_dt = to_utc(start_raw)
+            duration_min = int((to_utc(end_raw) - start_dt).total_seconds() // 60)
+            if duration_min > 60:
+                score += 2
+        except Exception:
+            duration_min = 0
 
     # High-stakes keywords
-    if any(kw in title for kw in HIGH_STAKES_KEYWORDS):
+    if _HIGH_STAKES_RE.search(title):
         score += 1
 
     # Routine keywords — reduce base score
-    if any(kw in title for kw in ROUTINE_KEYWORDS):
+    if _ROUTINE_RE.search(title):
         score -= 1
 
     # External attendees
-    user_email = config.get("user_email", "")
-    user_domain = user_email.split("@")[-1] if "@" in user_email else None
+    user_domain = ctx.user_domain
     has_external = False
     if user_domain:
         for att in attendees:
-            email = att.get("email", "")
-            if "@" in email and email.split("@")[-1] != user_domain and not att.get("self"):
+            if att is self_att:
+                continue
+            _, at, domain = att.get("email", "").rpartition("@")
+            if at and domain != user_domain and not att.get("self"):
                 has_external = True
                 break
     if has_external:
         score += 2
 
     # No description/agenda
-    if not description.strip():
+    if not has_description:
         score += 2
 
     # Timing
-    now = datetime.now(timezone.utc)
     hours_away = None
-    try:
-        if not is_all_day:
-            event_start = to_utc(start_raw)
-            hours_away = (event_start - now).total_seconds() / 3600
-            if 0 < hours_away <= 24:
-                score += 2
-    except Exception:
-        pass
+    if start_dt is not None:
+        hours_away = (start_dt - ctx.now).total_seconds() / 3600
+        if 0 < hours_away <= 24:
+            score += 2
 
     # Check if OpenClaw check-in already exists
     slug = title[:30]
-    already_has_checkin = any(slug in (t or "").lower() for t in openclaw_event_titles)
+    already_has_checkin = bool(ctx.checkin_index) and slug in ctx.checkin_index
     if already_has_checkin:
         score -= 5
 
@@ -216,26 +350,36 @@ def score_event(event: dict, config: dict, outcomes: list, openclaw_event_titles
 
     return {
         "id": event_id,
-        "summary": event.get("summary") or "(no title)",
-        "title": event.get("summary") or "(no title)",  # alias kept for compatibility
+        "summary": summary or "(no title)",
+        "title": summary or "(no title)",  # alias kept for compatibility
         "start": start_raw,
         "end": end_raw,
         "is_all_day": is_all_day,
         "duration_minutes": duration_min,
         "recurring_id": recurring_id,
-        "has_description": bool(description.strip()),
+        "has_description": has_description,
         "attendee_count": len(attendees),
         "has_external_attendees": has_external,
         "hours_away": round(hours_away, 1) if hours_away is not None else None,
         "already_has_checkin": already_has_checkin,
         "snoozed": is_snoozed(event_id, snoozed),
         "score": score,
-        "past_outcomes": len(outcomes),
+        "past_outcomes": ctx.totals_by_rid.get(recurring_id, 0) if recurring_id else 0,
         "event_type": event_type,
         "calendar": event.get("_calendar_name") or event.get("calendar", ""),
     }
 
 
+def sort_scored(events: list):
+    """Sort in place: score descending, then start ascending within a score.
+
+    Two stable C-keyed passes; sorting a subset this way keeps the same
+    relative order it has in the sorted full list.
+    """
+    events.sort(key=itemgetter("start"))
+    events.sort(key=itemgetter("score"), reverse=True)
+
+
 def classify_event(recurring_id, duration_min, attendees, has_external, outcomes) -> str:
     is_recurring = bool(recurring_id)
     avg_items = 0
@@ -252,18 +396,65 @@ def classify_event(recurring_id, duration_min, attendees, has_external, outcomes
 
 
 def is_cache_valid(config: dict) -> bool:
-    if not CACHE_FILE.exists():
-        return False
+    """Judge cache age by file mtime; write_cache() replaces the file atomically
+    at the end of each scan, so there is no need to parse it for scanned_at."""
     try:
-        data = json.loads(CACHE_FILE.read_text())
-        scanned_at = datetime.fromisoformat(data["scanned_at"])
-        if scanned_at.tzinfo is None:
-            scanned_at = scanned_at.replace(tzinfo=timezone.utc)
-        age_minutes = (datetime.now(timezone.utc) - scanned_at).total_seconds() / 60
-        cache_ttl = config.get("scan_cache_ttl_minutes", 30)
-        return age_minutes < cache_ttl
-    except Exception:
+        age_minutes = (time.time() - CACHE_FILE.stat().st_mtime) / 60
+    except OSError:
         return False
+    cache_ttl = config.get("scan_cache_ttl_minutes", 30)
+    return age_minutes < cache_ttl
+
+
+def _list_calendars(backend) -> tuple:
+    """backend.list_user_calendars(), reused per backend for CALENDAR_LIST_TTL_SECONDS."""
+    from cal_backend import list_calendars_cached
+    return list_calendars_cached(backend, CALENDAR_LIST_TTL_SECONDS)
+
+
+def _fetch_events(backend, cal_ids: list, time_min: datetime, time_max: datetime) -> list:
+    """Run backend.list_events for each calendar concurrently.
+
+    Returns one entry per cal_id, in input order: that calendar's events, or
+    None if the fetch failed. Each backend call opens its own connection.
+    """
+    if not cal_ids:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(cal_ids))) as ex:
+        futures = [ex.submit(backend.list_events, cal_id, time_min, time_max)
+                   for cal_id in cal_ids]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception:
+            results.append(None)
+    return results
+
+
+def write_cache(payload: bytes):
+    """Atomically replace the scan cache with an already-serialised payload.
+
+    Writing to a per-process temp file and renaming it means a concurrent
+    reader never sees a half-written file.
+    """
+    tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, CACHE_FILE)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _write_stdout(payload: bytes):
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:  # stdout replaced by a text-only stream
+        print(payload.decode())
+        return
+    sys.stdout.flush()
+    out.write(payload + b"\n")
+    out.flush()
 
 
 def scan_user_events(config: dict = None, backend=None, now=None, time_max=None) -> list:
@@ -292,11 +483,11 @@ def scan_user_events(config: dict = None, backend=None, now=None, time_max=None)
     ignored = config.get("ignored_calendars", [])
 
     try:
-        calendars = backend.list_user_calendars()
+        calendars = _list_calendars(backend)
     except Exception as e:
         return []
 
-    all_events = []
+    cal_list = []
     for cal in calendars:
         cal_id = cal["id"]
         # Skip action calendar
@@ -308,14 +499,17 @@ def scan_user_events(config: dict = None, backend=None, now=None, time_max=None)
         # If watched list is non-empty, only include those
         if watched and cal_id not in watched:
             continue
-        try:
-            events = backend.list_events(cal_id, now, time_max)
-            for event in events:
-                event["_calendar_name"] = cal.get("summary", "")
-                event["_calendar_id"] = cal_id
-                all_events.append(event)
-        except Exception:
-            pass
+        cal_list.append(cal)
+
+    all_events = []
+    fetched = _fetch_events(backend, [c["id"] for c in cal_list], now, time_max)
+    for cal, events in zip(cal_list, fetched):
+        if events is None:
+            continue
+        for event in events:
+            event["_calendar_name"] = cal.get("summary", "")
+            event["_calendar_id"] = cal["id"]
+            all_events.append(event)
 
     return all_events
 
@@ -334,12 +528,12 @@ def main():
 
     # Pattern lookup
     if args.patterns:
-        outcomes = load_outcomes(args.patterns)
-        print(json.dumps({
+        outcomes = load_all_outcomes_indexed().get(args.patterns, [])
+        print(_dumps({
             "recurring_id": args.patterns,
-            "total_outcomes": len(outcomes),
+            "total_outcomes": outcome_totals().get(args.patterns, 0),
             "outcomes": outcomes[-5:]
-        }, indent=2))
+        }))
         return
 
     # Snooze
@@ -362,7 +556,7 @@ def main():
 
     # Return cache if valid
     if not args.force and is_cache_valid(config):
-        print(CACHE_FILE.read_text())
+        _write_stdout(CACHE_FILE.read_bytes())
         return
 
     # Live scan
@@ -380,64 +574,65 @@ def main():
     time_max = now + timedelta(days=days_ahead)
     snoozed = load_snoozed()
 
-    # Get OpenClaw events for dedup check
-    openclaw_event_titles = []
+    # List calendars up front so a failure is reported; the result is cached,
+    # so scan_user_events() below does not fetch it again
     try:
-        openclaw_cal_id = backend.get_openclaw_cal_id()
-        openclaw_events = backend.list_events(openclaw_cal_id, now, time_max)
-        openclaw_event_titles = [(e.get("summary") or "").lower() for e in openclaw_events]
-    except Exception:
-        pass
-
-    # Fetch all user calendars
-    try:
-        calendars = backend.list_user_calendars()
+        _list_calendars(backend)
     except Exception as e:
         print(json.dumps({"error": "failed_to_list_calendars", "detail": str(e)}))
         sys.exit(1)
 
-    openclaw_cal_id_safe = config.get("openclaw_cal_id", "")
-    all_events = []
+    try:
+        openclaw_cal_id = backend.get_openclaw_cal_id()
+    except Exception:
+        openclaw_cal_id = None
 
-    for cal in calendars:
-        cal_id = cal["id"]
-        if cal_id == openclaw_cal_id_safe:
-            continue
+    # OpenClaw events (for dedup check) are fetched while the user calendars are scanned
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        openclaw_future = (ex.submit(backend.list_events, openclaw_cal_id, now, time_max)
+                           if openclaw_cal_id is not None else None)
+        all_events = scan_user_events(config=config, backend=backend, now=now, time_max=time_max)
+
+    openclaw_event_titles = []
+    if openclaw_future is not None:
         try:
-            events = backend.list_events(cal_id, now, time_max)
-            for event in events:
-                event["_calendar_name"] = cal.get("summary", "")
-                all_events.append(event)
+            openclaw_event_titles = [(e.get("summary") or "").lower()
+                                     for e in openclaw_future.result()]
         except Exception:
-            pass  # Skip unreadable calendars silently
+            pass
 
     # Score events
+    ctx = build_scoring_ctx(config, openclaw_event_titles)
     scored = []
+    actionable = []
     for event in all_events:
-        recurring_id = event.get("recurringEventId") or event.get("recurring_id") or ""
-        outcomes = load_outcomes(recurring_id) if recurring_id else []
-        result = score_event(event, config, outcomes, openclaw_event_titles, snoozed)
+        result = score_event(event, ctx, snoozed)
         if result is not None:
             scored.append(result)
+            if result["score"] >= ctx.calendar_threshold and not result["snoozed"]:
+                actionable.append(result)
 
-    scored.sort(key=lambda e: (-e["score"], e["start"] or ""))
+    sort_scored(scored)
+    sort_scored(actionable)
 
     output = {
         "scanned_at": now.isoformat(),
         "days_ahead": days_ahead,
         "timezone": get_user_timezone(config),
         "total_events": len(scored),
-        "actionable": [e for e in scored if e["score"] >= config.get("calendar_threshold", 6) and not e["snoozed"]],
+        "actionable": actionable,
         "events": scored,
     }
 
-    # Write cache
+    # Serialise once; the same indented bytes go to the cache and to stdout, so
+    # a fresh scan and a cache hit print identical output
+    payload = _dumps_bytes(output)
     try:
-        CACHE_FILE.write_text(json.dumps(output, indent=2))
+        write_cache(payload)
     except Exception:
         pass
 
-    print(json.dumps(output, indent=2))
+    _write_stdout(payload)
 
 
 if __name__ == "__main__":
@@ -18,10 +18,16 @@ Usage:
 from __future__ import annotations  # PEP 563 — required for Python 3.8 compat with dict[]/list[]/str|None hints
 
 import argparse
+import functools
+import hashlib
 import json
+import re
 import sqlite3
 import sys
+import time
 from datetime import datetime, timedelta, timezone
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 
 if sys.version_info < (3, 8):
@@ -55,13 +61,118 @@ CREATE TABLE IF NOT EXISTS team_events (
     event_end TEXT DEFAULT '',
     is_all_day INTEGER DEFAULT 0,
     synced_at TEXT DEFAULT '',
+    event_start_ts INTEGER,
     UNIQUE(member_email, event_id)
 );
 
 CREATE INDEX IF NOT EXISTS idx_te_member ON team_events(member_email);
 CREATE INDEX IF NOT EXISTS idx_te_start ON team_events(event_start);
+
+CREATE TABLE IF NOT EXISTS availability_cache (
+    key TEXT PRIMARY KEY,
+    computed_at TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+"""
+
+# Title index for shared_events(). Rows are upserted with ON CONFLICT DO UPDATE
+# (not INSERT OR REPLACE, whose implicit delete would skip the _ad trigger).
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS team_events_fts USING fts5(
+    event_title, content='team_events', content_rowid='id', tokenize='unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS team_events_fts_ai AFTER INSERT ON team_events BEGIN
+    INSERT INTO team_events_fts(rowid, event_title) VALUES (new.id, new.event_title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS team_events_fts_ad AFTER DELETE ON team_events BEGIN
+    INSERT INTO team_events_fts(team_events_fts, rowid, event_title)
+    VALUES ('delete', old.id, old.event_title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS team_events_fts_au AFTER UPDATE OF event_title ON team_events
+WHEN old.event_title IS NOT new.event_title BEGIN
+    INSERT INTO team_events_fts(team_events_fts, rowid, event_title)
+    VALUES ('delete', old.id, old.event_title);
+    INSERT INTO team_events_fts(rowid, event_title) VALUES (new.id, new.event_title);
+END;
+"""
+
+# ── Statements ───────────────────────────────────────────────────────────────
+# Shared, reused SQL. sqlite3's per-connection statement cache is keyed on the
+# SQL text, so hot statements are defined once here rather than re-spelled.
+
+# event_start_ts is derived by SQLite from ?4 (event_start), the same way the
+# migration backfills it, so offsets and 'Z' suffixes are normalised to UTC epoch.
+UPSERT_TEAM_EVENT_SQL = """
+    INSERT INTO team_events
+        (member_email, event_id, event_title, event_start, event_end,
+         is_all_day, synced_at, event_start_ts)
+    VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, CAST(strftime('%s', ?4) AS INTEGER))
+    ON CONFLICT(member_email, event_id) DO UPDATE SET
+        event_title = excluded.event_title,
+        event_start = excluded.event_start,
+        event_end = excluded.event_end,
+        is_all_day = excluded.is_all_day,
+        synced_at = excluded.synced_at,
+        event_start_ts = excluded.event_start_ts
+"""
+
+SELECT_OPTED_IN_SQL = "SELECT * FROM team_members WHERE opted_in = 1"
+
+UPDATE_LAST_SYNCED_SQL = "UPDATE team_members SET last_synced = ?, calendar_id = ? WHERE email = ?"
+
+# Rows whose start couldn't be parsed (NULL event_start_ts) go once they
+# haven't been re-synced within the same window.
+DELETE_OLD_EVENTS_SQL = """
+    DELETE FROM team_events
+    WHERE event_start_ts < ?1 OR (event_start_ts IS NULL AND synced_at < ?2)
+"""
+
+FTS_TITLE_MATCH_SQL = "SELECT rowid FROM team_events_fts WHERE team_events_fts MATCH ?"
+
+SHARED_WINDOW_SQL = """
+    SELECT te.*, tm.name as member_name
+    FROM team_events te
+    JOIN team_members tm ON te.member_email = tm.email
+    WHERE te.event_start_ts BETWEEN ? AND ?
+"""
+
+BUSY_WINDOW_SQL = """
+    SELECT event_start, event_end FROM team_events
+    WHERE event_start_ts BETWEEN ? AND ? AND is_all_day = 0
+"""
+
+# A memoised team_availability() result is only valid if no member has been
+# synced since it was computed (and it is younger than AVAILABILITY_CACHE_SECONDS).
+SELECT_AVAILABILITY_SQL = """
+    SELECT payload FROM availability_cache
+    WHERE key = ? AND computed_at > ?
+      AND computed_at > (SELECT COALESCE(MAX(last_synced), '') FROM team_members)
+"""
+
+UPSERT_AVAILABILITY_SQL = """
+    INSERT OR REPLACE INTO availability_cache (key, computed_at, payload) VALUES (?, ?, ?)
+"""
+
+DELETE_STALE_AVAILABILITY_SQL = "DELETE FROM availability_cache WHERE computed_at <= ?"
+
+# Email lists are bound as one JSON array parameter, so the SQL text (and the
+# cached prepared statement) is the same whatever the number of attendees.
+SELECT_MEMBERS_BY_EMAIL_SQL = """
+    SELECT * FROM team_members WHERE email IN (SELECT value FROM json_each(?))
 """
 
+SELECT_OPTED_IN_BY_EMAIL_SQL = (
+    SELECT_OPTED_IN_SQL + " AND email IN (SELECT value FROM json_each(?))")
+
+BUSY_WINDOW_BY_EMAIL_SQL = (
+    BUSY_WINDOW_SQL + " AND member_email IN (SELECT value FROM json_each(?))")
+
+# A word FTS5 (unicode61) can index: it must contain a letter or digit
+_FTS_INDEXABLE_RE = re.compile(r"[^\W_]")
+
 
 def load_config() -> dict:
     try:
@@ -75,10 +186,81 @@ def get_db() -> sqlite3.Connection:
     conn = sqlite3.connect(str(DB_FILE))
     conn.row_factory = sqlite3.Row
     conn.executescript(SCHEMA)
+    _migrate(conn)
+    _init_fts(conn)
     conn.commit()
+    # journal_mode is persistent, but SQLite silently ignores a change made
+    # inside a transaction — so commit first and check what the file uses.
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    if mode != "wal":
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    # Per-connection tuning: with WAL, NORMAL only fsyncs at checkpoints.
+    if mode == "wal":
+        conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20 MB
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    return conn
+
+
+def _open_ro() -> sqlite3.Connection:
+    conn = sqlite3.connect(f"{DB_FILE.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("SELECT event_start_ts FROM team_events LIMIT 0")  # schema is current
+    return conn
+
+
+def get_ro_db() -> sqlite3.Connection:
+    """
+    Read-only connection for the analysis paths (list_members, shared_events).
+    Under WAL it never takes write locks, so it doesn't contend with a --sync.
+    """
+    try:
+        conn = _open_ro()
+    except sqlite3.Error:
+        # Missing or not yet migrated database: create/upgrade it once, then retry
+        get_db().close()
+        conn = _open_ro()
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20 MB
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
     return conn
 
 
+def _migrate(conn: sqlite3.Connection):
+    """Bring team_events created by older versions up to the current columns."""
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(team_events)")}
+    if "event_start_ts" not in cols:
+        conn.execute("ALTER TABLE team_events ADD COLUMN event_start_ts INTEGER")
+        conn.execute("UPDATE team_events SET event_start_ts = "
+                     "CAST(strftime('%s', event_start) AS INTEGER)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_te_start_ts "
+                 "ON team_events(event_start_ts, is_all_day)")
+
+
+def _init_fts(conn: sqlite3.Connection):
+    """Create team_events_fts and index existing rows. No-op without FTS5."""
+    if _has_fts(conn):
+        return
+    try:
+        conn.executescript(FTS_SCHEMA)
+        conn.execute("INSERT INTO team_events_fts(team_events_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        pass  # SQLite built without FTS5 — shared_events indexes titles in Python
+
+
+def _has_fts(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'team_events_fts'").fetchone() is not None
+
+
+def _fts_any_word_query(words) -> str | None:
+    """'{a, b}' -> '"a" OR "b"', or None if some word has nothing FTS5 can index."""
+    if not words or not all(_FTS_INDEXABLE_RE.search(w) for w in words):
+        return None
+    return " OR ".join('"' + w.replace('"', '""') + '"' for w in words)
+
+
 # ── Member management ─────────────────────────────────────────────────────────
 
 def add_member(conn: sqlite3.Connection, email: str, name: str,
@@ -119,26 +301,31 @@ def remove_member(conn: sqlite3.Connection, email: str) -> dict:
 
 def list_members(conn: sqlite3.Connection) -> dict:
     """Return all registered team members."""
-    rows = conn.execute("SELECT * FROM team_members ORDER BY name").fetchall()
-    members = []
-    for row in rows:
-        event_count = conn.execute(
-            "SELECT COUNT(*) FROM team_events WHERE member_email = ?",
-            (row["email"],)).fetchone()[0]
-        members.append({
-            "email": row["email"],
-            "name": row["name"],
-            "opted_in": bool(row["opted_in"]),
-            "added_at": row["added_at"][:10] if row["added_at"] else "",
-            "last_synced": row["last_synced"][:10] if row["last_synced"] else "never",
-            "cached_events": event_count,
-        })
+    rows = conn.execute("""
+        SELECT tm.email, tm.name, tm.opted_in,
+               COALESCE(substr(tm.added_at, 1, 10), '') AS added_at,
+               COALESCE(NULLIF(substr(tm.last_synced, 1, 10), ''), 'never') AS last_synced,
+               COUNT(te.id) AS cached_events
+        FROM team_members tm
+        LEFT JOIN team_events te ON te.member_email = tm.email
+        GROUP BY tm.id
+        ORDER BY tm.name, tm.id
+    """).fetchall()
+    members = [dict(row) for row in rows]
+    for m in members:
+        m["opted_in"] = bool(m["opted_in"])
     return {"status": "ok", "members": members, "count": len(members)}
 
 
 # ── Calendar sync ─────────────────────────────────────────────────────────────
 
-def _find_member_calendar_id(backend, email: str) -> str | None:
+def _user_calendars() -> tuple:
+    """(id, summary) for each of the user's calendars, from the shared list cache."""
+    from cal_backend import list_calendars_cached
+    return tuple((c["id"], c.get("summary", "")) for c in list_calendars_cached())
+
+
+def _find_member_calendar_id(email: str) -> str | None:
     """
     Attempt to locate a team member's calendar.
     Works if:
@@ -146,93 +333,153 @@ def _find_member_calendar_id(backend, email: str) -> str | None:
     - Their email matches a calendar ID directly (Google Workspace shared cals)
     """
     try:
-        calendars = backend.list_user_calendars()
         email_lower = email.lower()
-        for cal in calendars:
-            cal_id = (cal.get("id") or "").lower()
-            summary = (cal.get("summary") or "").lower()
-            if email_lower in cal_id or email_lower in summary:
-                return cal["id"]
+        for cal_id, summary in _user_calendars():
+            if email_lower in (cal_id or "").lower() or email_lower in (summary or "").lower():
+                return cal_id
     except Exception:
         pass
     # Fallback: use email as calendar ID (works for Google Workspace shared calendars)
     return email
 
 
-def sync_member(conn: sqlite3.Connection, member: sqlite3.Row) -> dict:
-    """Sync upcoming events for a single team member."""
+SYNC_DAYS_AHEAD = 14
+
+
+def _store_member_events(conn: sqlite3.Connection, member: sqlite3.Row, cal_id: str,
+                         events, now: datetime) -> dict:
+    """Write one member's fetched events (or the fetch error) to the cache."""
+    email = member["email"]
+    if isinstance(events, Exception):
+        # Member's calendar not accessible — likely not shared
+        return {
+            "status": "not_accessible",
+            "email": email,
+            "message": f"Calendar not accessible: {events}. "
+                       "Ask {member['name'] or email} to share their calendar with you.",
+        }
+
+    now_iso = now.isoformat()
+    rows = []
+    for e in events:
+        event_id = e.get("id", "")
+        title = e.get("summary", "")
+        start_obj = e.get("start") or {}
+        end_obj = e.get("end") or {}
+        start = start_obj.get("dateTime") or start_obj.get("date", "")
+        end_dt = end_obj.get("dateTime") or end_obj.get("date", "")
+        is_all_day = 1 if ("date" in start_obj and "dateTime" not in start_obj) else 0
+        rows.append((email, event_id, title, start, end_dt, is_all_day, now_iso))
+
+    # One transaction per member: upserts and last_synced commit together
+    with conn:
+        try:
+            conn.executemany(UPSERT_TEAM_EVENT_SQL, rows)
+            synced = len(rows)
+        except sqlite3.Error:
+            # A malformed row aborts executemany; retry row by row, skipping bad ones
+            synced = 0
+            for row in rows:
+                try:
+                    conn.execute(UPSERT_TEAM_EVENT_SQL, row)
+                    synced += 1
+                except sqlite3.Error:
+                    pass
+
+        # Update last_synced
+        conn.execute(UPDATE_LAST_SYNCED_SQL, (now_iso, cal_id, email))
+
+    return {"status": "ok", "email": email, "synced": synced}
+
+
+def sync_member(conn: sqlite3.Connection, member: sqlite3.Row, prune: bool = True) -> dict:
+    """Sync upcoming events for a single team member, then prune old events
+    (sync_all passes prune=False and prunes once for the whole team)."""
     try:
-        from cal_backend import CalendarBackend
-        backend = CalendarBackend()
+        from cal_backend import get_backend
+        backend = get_backend()
         email = member["email"]
-        cal_id = member["calendar_id"] or _find_member_calendar_id(backend, email) or email
+        cal_id = member["calendar_id"] or _find_member_calendar_id(email) or email
 
         now = datetime.now(timezone.utc)
-        end = now + timedelta(days=14)
+        end = now + timedelta(days=SYNC_DAYS_AHEAD)
 
         try:
             events = backend.list_events(cal_id, now, end)
         except Exception as e:
-            # Member's calendar not accessible — likely not shared
-            return {
-                "status": "not_accessible",
-                "email": email,
-                "message": f"Calendar not accessible: {e}. "
-                           "Ask {member['name'] or email} to share their calendar with you.",
-            }
+            events = e
+        result = _store_member_events(conn, member, cal_id, events, now)
+        if prune:
+            prune_old_events(conn, now)
+        return result
+    except Exception as e:
+        return {"status": "error", "email": member["email"], "message": str(e)}
 
-        now_iso = now.isoformat()
-        synced = 0
-        for e in events:
-            event_id = e.get("id", "")
-            title = e.get("summary", "")
-            start = (e.get("start") or {}).get("dateTime") or (e.get("start") or {}).get("date", "")
-            end_dt = (e.get("end") or {}).get("dateTime") or (e.get("end") or {}).get("date", "")
-            is_all_day = int("date" in (e.get("start") or {}) and
-                             "dateTime" not in (e.get("start") or {}))
-            try:
-                conn.execute("""
-                    INSERT OR REPLACE INTO team_events
-                        (member_email, event_id, event_title, event_start, event_end,
-                         is_all_day, synced_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (email, event_id, title, start, end_dt, is_all_day, now_iso))
-                synced += 1
-            except Exception:
-                pass
 
-        # Update last_synced
-        conn.execute("UPDATE team_members SET last_synced = ?, calendar_id = ? WHERE email = ?",
-                     (now_iso, cal_id, email))
-        conn.commit()
+def _list_events_or_error(backend, cal_id: str, time_min: datetime, time_max: datetime):
+    try:
+        return backend.list_events(cal_id, time_min, time_max)
+    except Exception as e:
+        return e
 
-        # Clean up old events (older than 2 days)
-        cutoff = (now - timedelta(days=2)).isoformat()
-        conn.execute("DELETE FROM team_events WHERE member_email = ? AND event_start < ?",
-                     (email, cutoff))
-        conn.commit()
 
-        return {"status": "ok", "email": email, "synced": synced}
-    except Exception as e:
-        return {"status": "error", "email": member["email"], "message": str(e)}
+def prune_old_events(conn: sqlite3.Connection, now: datetime) -> int:
+    """Drop cached events that started more than 2 days ago, for every member."""
+    cutoff = now - timedelta(days=2)
+    with conn:
+        return conn.execute(DELETE_OLD_EVENTS_SQL,
+                            (int(cutoff.timestamp()), cutoff.isoformat())).rowcount
 
 
 def sync_all(conn: sqlite3.Connection) -> dict:
-    """Sync all opted-in team members."""
-    members = conn.execute(
-        "SELECT * FROM team_members WHERE opted_in = 1").fetchall()
+    """Sync all opted-in team members.
+
+    All members' calendars are fetched in one batched backend call (Google
+    batches the HTTP requests, Nextcloud fans out on a thread pool); if that
+    fails as a whole, they are fetched one at a time.
+    Database writes always happen afterwards on the calling thread, and old
+    events are pruned once for the whole team at the end.
+    """
+    members = conn.execute(SELECT_OPTED_IN_SQL).fetchall()
     if not members:
         return {"status": "ok", "message": "No team members registered. "
                 "Add one with --add-member.", "results": []}
-    results = [sync_member(conn, m) for m in members]
+    now = datetime.now(timezone.utc)
+    try:
+        from cal_backend import get_backend
+        backend = get_backend()
+        cal_ids = [m["calendar_id"] or _find_member_calendar_id(m["email"]) or m["email"]
+                   for m in members]
+        end = now + timedelta(days=SYNC_DAYS_AHEAD)
+        requests = [(cal_id, now, end) for cal_id in cal_ids]
+    except Exception:
+        results = [sync_member(conn, m, prune=False) for m in members]
+    else:
+        try:
+            fetched = backend.batch_list_events(requests)
+        except Exception:
+            fetched = [_list_events_or_error(backend, *r) for r in requests]
+        results = []
+        for m, cal_id, events in zip(members, cal_ids, fetched):
+            try:
+                results.append(_store_member_events(conn, m, cal_id, events, now))
+            except Exception as e:
+                results.append({"status": "error", "email": m["email"], "message": str(e)})
+    try:
+        prune_old_events(conn, now)
+    except sqlite3.Error:
+        pass
     ok = sum(1 for r in results if r.get("status") == "ok")
     return {"status": "ok", "synced": ok, "total": len(results), "results": results}
 
 
 # ── Analysis ──────────────────────────────────────────────────────────────────
 
-def _parse_window(window_str: str) -> tuple[datetime, datetime]:
-    """Simple window parser for common phrases."""
+WINDOW_CACHE_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_window_cached(window_str: str, ttl_bucket: int) -> tuple[datetime, datetime]:
     from cal_editor import parse_nl_window
     result = parse_nl_window(window_str)
     if result:
@@ -241,16 +488,25 @@ def _parse_window(window_str: str) -> tuple[datetime, datetime]:
     return now, now + timedelta(days=7)
 
 
+def _parse_window(window_str: str) -> tuple[datetime, datetime]:
+    """Simple window parser for common phrases.
+
+    Results are reused for up to WINDOW_CACHE_SECONDS, so relative phrases
+    like "this week" still roll forward.
+    """
+    return _parse_window_cached(window_str, int(time.time() // WINDOW_CACHE_SECONDS))
+
+
 def shared_events(conn: sqlite3.Connection, window_str: str = "this week") -> dict:
     """Find events that appear in both the user's calendar and team members' calendars."""
     try:
-        from cal_backend import CalendarBackend
-        backend = CalendarBackend()
+        from cal_backend import get_backend
+        backend = get_backend()
         win_start, win_end = _parse_window(window_str)
         user_events = []
-        for cal in backend.list_user_calendars():
+        for cal_id, _ in _user_calendars():
             try:
-                evts = backend.list_events(cal["id"], win_start, win_end)
+                evts = backend.list_events(cal_id, win_start, win_end)
                 user_events.extend(evts)
             except Exception:
                 pass
@@ -258,34 +514,54 @@ def shared_events(conn: sqlite3.Connection, window_str: str = "this week") -> di
         return {"status": "error", "message": str(e)}
 
     # Get team events in window
-    team_rows = conn.execute("""
-        SELECT te.*, tm.name as member_name
-        FROM team_events te
-        JOIN team_members tm ON te.member_email = tm.email
-        WHERE te.event_start >= ? AND te.event_start <= ?
-    """, (win_start.isoformat(), win_end.isoformat())).fetchall()
-
-    # Match by title similarity
+    team_rows = conn.execute(
+        SHARED_WINDOW_SQL, (int(win_start.timestamp()), int(win_end.timestamp()))).fetchall()
+
+    # Team titles are normalised once. Candidate rows for the word-overlap test
+    # come from team_events_fts, or from a Python word -> row-index map without FTS5.
+    team_titles = [(t_row["event_title"] or "").lower().strip() for t_row in team_rows]
+    team_words = [set(t_title.split()) for t_title in team_titles]
+    id_to_index = {t_row["id"]: i for i, t_row in enumerate(team_rows)}
+    team_by_word: dict[str, list[int]] | None = None
+    if not _has_fts(conn):
+        team_by_word = {}
+        for i, words in enumerate(team_words):
+            for w in words:
+                team_by_word.setdefault(w, []).append(i)
+
+    # Match by title similarity: the first team row (in query order) that either
+    # shares >50% of words or contains / is contained in the user title
     shared = []
     for u_event in user_events:
         u_title = (u_event.get("summary") or "").lower().strip()
         if not u_title:
             continue
-        for t_row in team_rows:
-            t_title = (t_row["event_title"] or "").lower().strip()
-            if not t_title:
-                continue
-            # Simple match: 60%+ word overlap
-            u_words = set(u_title.split())
-            t_words = set(t_title.split())
-            overlap = len(u_words & t_words) / max(len(u_words | t_words), 1)
-            if overlap > 0.5 or u_title in t_title or t_title in u_title:
-                shared.append({
-                    "title": u_event.get("summary"),
-                    "start": (u_event.get("start") or {}).get("dateTime", ""),
-                    "also_on": t_row["member_name"] or t_row["member_email"],
-                })
+        u_words = set(u_title.split())
+        match = None
+        # Word overlap needs at least one shared word, so only rows containing
+        # one of the user's words can qualify
+        if team_by_word is not None:
+            candidates = set().union(*(team_by_word[w] for w in u_words if w in team_by_word))
+        else:
+            candidates = _fts_candidates(conn, u_words, id_to_index)
+        for i in sorted(candidates):
+            t_words = team_words[i]
+            if len(u_words & t_words) / max(len(u_words | t_words), 1) > 0.5:
+                match = i
+                break
+        # Substring matches can share no whole word; check rows ahead of the overlap match
+        for i in range(len(team_titles) if match is None else match):
+            t_title = team_titles[i]
+            if t_title and (u_title in t_title or t_title in u_title):
+                match = i
                 break
+        if match is not None:
+            t_row = team_rows[match]
+            shared.append({
+                "title": u_event.get("summary"),
+                "start": (u_event.get("start") or {}).get("dateTime", ""),
+                "also_on": t_row["member_name"] or t_row["member_email"],
+            })
 
     return {
         "status": "ok",
@@ -295,68 +571,36 @@ def shared_events(conn: sqlite3.Connection, window_str: str = "this week") -> di
     }
 
 
-def team_availability(conn: sqlite3.Connection,
-                       window_str: str = "this week",
-                       duration_minutes: int = 60) -> dict:
-    """Find time slots when all team members are free."""
-    win_start, win_end = _parse_window(window_str)
-    members = conn.execute(
-        "SELECT * FROM team_members WHERE opted_in = 1").fetchall()
-    if not members:
-        return {"status": "ok", "message": "No team members registered.", "free_slots": []}
-
-    # Collect all busy times
-    all_busy: list[tuple[datetime, datetime]] = []
+def _fts_candidates(conn: sqlite3.Connection, words: set, id_to_index: dict):
+    """Indexes of windowed team rows whose title contains any of `words`.
 
-    # User's own calendar
+    Every row sharing a whitespace-delimited word also matches that word as an
+    FTS phrase, so this is a superset of the rows that can pass the overlap
+    test. Falls back to every row if a word is not indexable.
+    """
+    query = _fts_any_word_query(words)
+    if query is None:
+        return set(id_to_index.values())
     try:
-        from cal_backend import CalendarBackend
-        backend = CalendarBackend()
-        for cal in backend.list_user_calendars():
-            try:
-                for e in backend.list_events(cal["id"], win_start, win_end):
-                    s = (e.get("start") or {}).get("dateTime")
-                    en = (e.get("end") or {}).get("dateTime")
-                    if s and en:
-                        try:
-                            all_busy.append((
-                                datetime.fromisoformat(s.replace("Z", "+00:00")),
-                                datetime.fromisoformat(en.replace("Z", "+00:00"))))
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-    except Exception:
-        pass
+        rows = conn.execute(FTS_TITLE_MATCH_SQL, (query,))
+        return {id_to_index[r[0]] for r in rows if r[0] in id_to_index}
+    except sqlite3.OperationalError:
+        return set(id_to_index.values())
 
-    # Team members' cached events
-    team_rows = conn.execute("""
-        SELECT event_start, event_end FROM team_events
-        WHERE event_start >= ? AND event_start <= ? AND is_all_day = 0
-    """, (win_start.isoformat(), win_end.isoformat())).fetchall()
 
-    for row in team_rows:
-        try:
-            s = datetime.fromisoformat(row["event_start"].replace("Z", "+00:00"))
-            e = datetime.fromisoformat(row["event_end"].replace("Z", "+00:00"))
-            if s.tzinfo is None:
-                s = s.replace(tzinfo=timezone.utc)
-            if e.tzinfo is None:
-                e = e.replace(tzinfo=timezone.utc)
-            all_busy.append((s, e))
-        except Exception:
-            pass
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp ('Z' suffix allowed) to an aware datetime; naive means UTC."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    dt = datetime.fromisoformat(value)
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
-    # Merge and find gaps (same logic as cal_editor.py)
-    all_busy.sort(key=lambda x: x[0])
-    merged: list[list[datetime]] = []
-    for bs, be in all_busy:
-        if merged and bs < merged[-1][1]:
-            merged[-1][1] = max(merged[-1][1], be)
-        else:
-            merged.append([bs, be])
 
-    free_slots = []
+def _iter_free_slots(merged: list[tuple[datetime, datetime]],
+                     win_start: datetime, win_end: datetime,
+                     duration_minutes: int, member_count: int):
+    """Yield free slots between merged busy intervals, in time order."""
     cursor = win_start
     if cursor.hour < 8:
         cursor = cursor.replace(hour=8, minute=0, second=0, microsecond=0)
@@ -365,12 +609,12 @@ def team_availability(conn: sqlite3.Connection,
         if cursor < bs:
             gap = int((bs - cursor).total_seconds() / 60)
             if gap >= duration_minutes:
-                free_slots.append({
+                yield {
                     "start": cursor.isoformat(),
                     "end": (cursor + timedelta(minutes=duration_minutes)).isoformat(),
                     "available_minutes": gap,
-                    "team_members": len(members),
-                })
+                    "team_members": member_count,
+                }
         cursor = max(cursor, be)
         biz_end = cursor.replace(hour=18, minute=0, second=0, microsecond=0)
         if cursor >= biz_end:
@@ -382,14 +626,123 @@ def team_availability(conn: sqlite3.Connection,
     if cursor < win_end:
         gap = int((win_end - cursor).total_seconds() / 60)
         if gap >= duration_minutes:
-            free_slots.append({
+            yield {
                 "start": cursor.isoformat(),
                 "end": (cursor + timedelta(minutes=duration_minutes)).isoformat(),
                 "available_minutes": gap,
-                "team_members": len(members),
-            })
+                "team_members": member_count,
+            }
 
-    return {
+
+AVAILABILITY_CACHE_SECONDS = 300
+
+
+def _availability_key(*parts) -> str:
+    return hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+
+
+def _cached_availability(conn: sqlite3.Connection, key: str) -> dict | None:
+    oldest = (datetime.now(timezone.utc)
+              - timedelta(seconds=AVAILABILITY_CACHE_SECONDS)).isoformat()
+    try:
+        row = conn.execute(SELECT_AVAILABILITY_SQL, (key, oldest)).fetchone()
+        return json.loads(row["payload"]) if row else None
+    except (sqlite3.Error, ValueError):
+        return None
+
+
+def _store_availability(conn: sqlite3.Connection, key: str, result: dict):
+    now = datetime.now(timezone.utc)
+    oldest = (now - timedelta(seconds=AVAILABILITY_CACHE_SECONDS)).isoformat()
+    try:
+        with conn:
+            conn.execute(DELETE_STALE_AVAILABILITY_SQL, (oldest,))
+            conn.execute(UPSERT_AVAILABILITY_SQL, (key, now.isoformat(), json.dumps(result)))
+    except sqlite3.Error:
+        pass
+
+
+def team_availability(conn: sqlite3.Connection,
+                      window_str: str = "this week",
+                      duration_minutes: int = 60,
+                      attendee_emails: list[str] | None = None,
+                      max_slots: int | None = None) -> dict:
+    """
+    Find time slots when all team members are free.
+    With attendee_emails, only those members' busy times are considered;
+    max_slots stops the search once that many slots have been found.
+    Results are memoised in availability_cache until the next sync.
+    """
+    win_start, win_end = _parse_window(window_str)
+    busy_sql = BUSY_WINDOW_SQL
+    busy_params: tuple = (int(win_start.timestamp()), int(win_end.timestamp()))
+    if attendee_emails is None:
+        members = conn.execute(SELECT_OPTED_IN_SQL).fetchall()
+        if not members:
+            return {"status": "ok", "message": "No team members registered.", "free_slots": []}
+    else:
+        emails = json.dumps([e.lower().strip() for e in attendee_emails])
+        members = conn.execute(SELECT_OPTED_IN_BY_EMAIL_SQL, (emails,)).fetchall()
+        busy_sql = BUSY_WINDOW_BY_EMAIL_SQL
+        busy_params += (emails,)
+
+    key = _availability_key(
+        window_str, win_start.isoformat(), win_end.isoformat(), duration_minutes, max_slots,
+        attendee_emails is not None, ",".join(sorted(m["email"] for m in members)))
+    cached = _cached_availability(conn, key)
+    if cached is not None:
+        return cached
+
+    # Collect all busy times
+    all_busy: list[tuple[datetime, datetime]] = []
+
+    # User's own calendar
+    try:
+        from cal_backend import get_backend
+        backend = get_backend()
+        for cal_id, _ in _user_calendars():
+            try:
+                for e in backend.list_events(cal_id, win_start, win_end):
+                    s = (e.get("start") or {}).get("dateTime")
+                    en = (e.get("end") or {}).get("dateTime")
+                    if s and en:
+                        try:
+                            all_busy.append((_parse_iso(s), _parse_iso(en)))
+                        except Exception:
+                            pass
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    # Team members' cached events
+    team_rows = conn.execute(busy_sql, busy_params).fetchall()
+
+    for row in team_rows:
+        try:
+            all_busy.append((_parse_iso(row["event_start"]), _parse_iso(row["event_end"])))
+        except Exception:
+            pass
+
+    # Merge and find gaps (same logic as cal_editor.py)
+    all_busy.sort(key=itemgetter(0))
+    merged: list[tuple[datetime, datetime]] = []
+    cur_start = cur_end = None
+    for bs, be in all_busy:
+        if cur_end is not None and bs < cur_end:
+            if be > cur_end:
+                cur_end = be
+        else:
+            if cur_end is not None:
+                merged.append((cur_start, cur_end))
+            cur_start, cur_end = bs, be
+    if cur_end is not None:
+        merged.append((cur_start, cur_end))
+
+    slots = _iter_free_slots(merged, win_start, win_end, duration_minutes, len(members))
+    free_slots = list(slots if max_slots is None else islice(slots, max_slots))
+
+    result = {
         "status": "ok",
         "window": window_str,
         "duration_minutes": duration_minutes,
@@ -397,6 +750,8 @@ def team_availability(conn: sqlite3.Connection,
         "free_slots": free_slots[:8],
         "total_found": len(free_slots),
     }
+    _store_availability(conn, key, result)
+    return result
 
 
 def suggest_meeting_time(conn: sqlite3.Connection, title: str,
@@ -409,16 +764,16 @@ def suggest_meeting_time(conn: sqlite3.Connection, title: str,
     # Filter team members to only the requested attendees
     if not attendee_emails:
         return {"status": "error", "message": "No attendee emails provided."}
-    placeholders = ",".join("?" * len(attendee_emails))
     members = conn.execute(
-        f"SELECT * FROM team_members WHERE email IN ({placeholders})",
-        [e.lower().strip() for e in attendee_emails]).fetchall()
+        SELECT_MEMBERS_BY_EMAIL_SQL,
+        (json.dumps([e.lower().strip() for e in attendee_emails]),)).fetchall()
 
-    missing = [e for e in attendee_emails
-               if e.lower().strip() not in [m["email"] for m in members]]
+    found = {m["email"] for m in members}
+    missing = [e for e in attendee_emails if e.lower().strip() not in found]
 
-    avail = team_availability(conn, "this week", duration_minutes)
-    slots = avail.get("free_slots", [])[:3]
+    avail = team_availability(conn, "this week", duration_minutes,
+                              attendee_emails=attendee_emails, max_slots=3)
+    slots = avail.get("free_slots", [])
 
     return {
         "status": "ok",
@@ -449,7 +804,11 @@ def main():
                         help="Sync all team member calendars")
     args = parser.parse_args()
 
-    conn = get_db()
+    # Listing and shared-event analysis never write; availability memoises, so it
+    # stays on the read-write connection along with member changes and --sync.
+    read_only = not (args.add_member or args.remove_member) and (
+        args.list_members or args.shared_events is not None)
+    conn = get_ro_db() if read_only else get_db()
 
     if args.add_member:
         email = args.add_member[0]
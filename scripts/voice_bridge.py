@@ -7,32 +7,62 @@ action. Works standalone or as a bridge called by the whisper skill.
 
 Usage:
   python3 voice_bridge.py --transcribe /path/to/audio.wav
+  python3 voice_bridge.py --transcribe-batch a.wav b.wav  # several files, one model load
   python3 voice_bridge.py --route "move my sprint review to next Monday"
   python3 voice_bridge.py --record --seconds 10           # record + transcribe
+  python3 voice_bridge.py --stream --seconds 30           # route as soon as the sentence ends
   python3 voice_bridge.py --check-whisper                 # check if whisper skill available
+  python3 voice_bridge.py --shutdown-whisper              # stop the persistent Whisper worker
 
 Whisper skill integration:
   If the 'whisper' skill is installed at ~/.openclaw/workspace/skills/whisper/,
   this bridge calls it for transcription. Otherwise falls back to the
   openai-whisper Python package if installed, then to os speech recognition.
+  The openai-whisper model is held by a persistent worker (voice_bridge_worker.py)
+  so it is loaded once rather than on every call.
 """
 
 import argparse
+import base64
+import contextlib
+import functools
 import json
 import os
+import queue
 import re
 import shutil
+import socket
 import subprocess
 import sys
+import threading
+import time
+import wave
 from pathlib import Path
 
 if sys.version_info < (3, 8):
     print(json.dumps({"error": "python_version_too_old", "detail": "Python 3.8+ required."}))
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Child scripts' JSON output; orjson accepts str or bytes, as does json.loads
+_loads = orjson.loads if orjson is not None else json.loads
+
 SKILL_DIR = Path.home() / ".openclaw/workspace/skills/proactive-claw"
 WHISPER_SKILL_DIR = Path.home() / ".openclaw/workspace/skills/whisper"
 CONFIG_FILE = SKILL_DIR / "config.json"
+WHISPER_SOCKET = SKILL_DIR / "whisper.sock"
+WHISPER_WORKER = Path(__file__).resolve().with_name("voice_bridge_worker.py")
+WHISPER_STARTUP_TIMEOUT_SECONDS = 10
+
+STREAM_SAMPLE_RATE = 16000
+STREAM_CHUNK_SECONDS = 5        # transcribe the rolling buffer this often
+STREAM_WINDOW_SECONDS = 10      # partials cover at most this much trailing audio
+STREAM_SILENCE_SECONDS = 2      # end of utterance after this much quiet
+STREAM_SILENCE_PEAK = 500       # int16 peak below which a block counts as quiet
 sys.path.insert(0, str(SKILL_DIR / "scripts"))
 
 # ── Intent routing table ──────────────────────────────────────────────────────
@@ -92,6 +122,131 @@ INTENTS = [
      "policy_engine.py", ["--parse", "{0}"]),
 ]
 
+_PLACEHOLDER_RE = re.compile(r"\{(\d+)\}")
+
+
+def _tokenize_args(args_template: list) -> tuple:
+    """
+    Pre-resolve an args template into tokens: ("ph", key) for an argument that is
+    exactly one placeholder, ("lit", text) for a literal, and ("fmt", template)
+    for the rare literal with an embedded placeholder.
+    """
+    tokens = []
+    for arg in args_template:
+        m = _PLACEHOLDER_RE.fullmatch(arg)
+        if m:
+            tokens.append(("ph", m.group(1)))
+        elif _PLACEHOLDER_RE.search(arg):
+            tokens.append(("fmt", arg))
+        else:
+            tokens.append(("lit", arg))
+    return tuple(tokens)
+
+
+def _combine_intents(compiled: list):
+    """
+    Fold all intents into one anchored alternation, ^(?:.*?(?P<i0>p0)|.*?(?P<i1>p1)|...).
+    Alternatives are tried in table order and each lazy .*? scans start positions
+    left to right, so the first alternative to match is exactly the intent a
+    linear loop of pattern.search() calls would pick. Returns the regex and, per
+    intent, the (first, last) indices of its own capture groups.
+    """
+    parts, spans = [], []
+    group = 0
+    for k, (cre, pattern, _, _) in enumerate(compiled):
+        group += 1  # the (?P<i{k}>...) wrapper
+        spans.append((group, group + cre.groups))
+        group += cre.groups
+        parts.append(f".*?(?P<i{k}>{pattern})")
+    return re.compile("^(?:" + "|".join(parts) + ")", re.IGNORECASE), spans
+
+
+_STATIC_EXPANSION_LIMIT = 64
+_REGEX_SPECIALS = set(".^$*+?{}[]\\|()")
+
+
+def _expand_literal(pattern: str):
+    """
+    Enumerate every string a pattern matches in full, if it is built only from
+    literal characters, (?:a|b) groups and ? quantifiers. Returns a set, or None
+    for anything richer (captures, classes, repetition) or too many variants.
+    """
+    pos = 0
+
+    def alternation():
+        nonlocal pos
+        out = sequence()
+        while out is not None and pos < len(pattern) and pattern[pos] == "|":
+            pos += 1
+            more = sequence()
+            out = None if more is None else out | more
+        return out
+
+    def sequence():
+        nonlocal pos
+        out = {""}
+        while pos < len(pattern) and pattern[pos] not in "|)":
+            if pattern.startswith("(?:", pos):
+                pos += 3
+                atom = alternation()
+                if atom is None or pos >= len(pattern) or pattern[pos] != ")":
+                    return None
+                pos += 1
+            elif pattern[pos] in _REGEX_SPECIALS:
+                return None
+            else:
+                atom = {pattern[pos]}
+                pos += 1
+            if pos < len(pattern) and pattern[pos] == "?":
+                pos += 1
+                atom = atom | {""}
+            out = {a + b for a in out for b in atom}
+            if len(out) > _STATIC_EXPANSION_LIMIT:
+                return None
+        return out
+
+    result = alternation()
+    return result if pos == len(pattern) else None
+
+
+def _build_static_routes(compiled: list, combined, spans: list) -> dict:
+    """
+    Map each exact phrase of the capture-free fixed-phrase intents to the intent
+    that regex routing would pick for it. The phrase is resolved through the
+    regex matcher, so an earlier, broader intent still wins, as it does in the
+    regex scan. Only phrases that resolve to a capture-free intent are kept.
+    """
+    routes = {}
+    for cre, pattern, _, _ in compiled:
+        if cre.groups:
+            continue
+        for phrase in _expand_literal(pattern) or ():
+            match = _match_intent_regex(phrase, compiled, combined, spans)
+            if phrase and match is not None and not compiled[match[0]][0].groups:
+                routes.setdefault(phrase, match[0])
+    return routes
+
+
+@functools.lru_cache(maxsize=1)
+def _routing_tables():
+    """
+    Build the routing tables on first use rather than at import, so invocations
+    that never route (--check-whisper, --transcribe, ...) don't compile them.
+    Returns (compiled intents, combined regex, group spans, static routes), where
+    each compiled intent is (regex, pattern, script, args_tokens); the source
+    pattern is kept for the "intent_matched" response field.
+    """
+    compiled = [(re.compile(pattern, re.IGNORECASE), pattern, script_name,
+                 _tokenize_args(args_template))
+                for pattern, script_name, args_template in INTENTS]
+    try:
+        combined, spans = _combine_intents(compiled)
+    except re.error:
+        combined, spans = None, []
+    # Fixed phrases ("stale contacts", "weekly digest", ...) resolve with one dict lookup
+    static = _build_static_routes(compiled, combined, spans)
+    return compiled, combined, spans, static
+
 
 def load_config() -> dict:
     try:
@@ -101,45 +256,258 @@ def load_config() -> dict:
         return {}
 
 
+# Meta-path finders that never resolve "whisper" outside sys.path
+# (DistutilsMetaFinder is setuptools' shim and only handles distutils/pip).
+_STANDARD_FINDERS = {"BuiltinImporter", "FrozenImporter", "PathFinder", "DistutilsMetaFinder"}
+
+
+def _whisper_package_origin():
+    """
+    Locate the openai-whisper package by looking for whisper/__init__.py on
+    sys.path. importlib's find_spec is only used when that is inconclusive:
+    zip/egg path entries, a namespace-style whisper/ directory, or extra
+    meta-path finders (e.g. editable installs).
+    """
+    mod = sys.modules.get("whisper")
+    if mod is not None:
+        return getattr(mod, "__file__", None) or "whisper"
+    inconclusive = any(getattr(f, "__name__", type(f).__name__) not in _STANDARD_FINDERS
+                       for f in sys.meta_path)
+    for entry in sys.path:
+        base = Path(entry or ".")
+        for candidate in (base / "whisper" / "__init__.py", base / "whisper.py"):
+            if candidate.is_file():
+                return str(candidate)
+        if base.is_file() or (base / "whisper").is_dir():
+            inconclusive = True
+    if not inconclusive:
+        return None
+    try:
+        import importlib.util
+        spec = importlib.util.find_spec("whisper")
+        return (spec.origin or "whisper") if spec else None
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def check_whisper_skill() -> dict:
-    """Check which transcription backend is available."""
-    backends = []
+    """
+    Check which transcription backend is available.
+    Probed once per process; call check_whisper_skill.cache_clear() (or pass
+    --refresh-backends) to pick up a backend installed mid-session.
+    Backends are listed in preference order in backend_names, with their
+    locations in backend_paths; describe_backends() gives the verbose form.
+    """
+    paths = {}
 
     # 1. OpenClaw whisper skill
     whisper_main = WHISPER_SKILL_DIR / "scripts" / "transcribe.py"
     if whisper_main.exists():
-        backends.append({"name": "whisper_skill", "path": str(whisper_main), "available": True})
+        paths["whisper_skill"] = str(whisper_main)
 
     # 2. openai-whisper Python package
-    try:
-        import importlib.util
-        spec = importlib.util.find_spec("whisper")
-        if spec:
-            backends.append({"name": "openai_whisper", "path": spec.origin, "available": True})
-    except Exception:
-        pass
+    whisper_pkg = _whisper_package_origin()
+    if whisper_pkg:
+        paths["openai_whisper"] = whisper_pkg
 
     # 3. whisper CLI
     whisper_cli = shutil.which("whisper")
     if whisper_cli:
-        backends.append({"name": "whisper_cli", "path": whisper_cli, "available": True})
+        paths["whisper_cli"] = whisper_cli
 
     # 4. ffmpeg (required for any audio processing)
     ffmpeg = shutil.which("ffmpeg")
 
+    names = tuple(paths)
     return {
         "status": "ok",
-        "backends": backends,
-        "preferred": backends[0]["name"] if backends else None,
+        "backend_names": names,
+        "backend_paths": paths,
+        "preferred": names[0] if names else None,
         "ffmpeg_available": bool(ffmpeg),
-        "can_transcribe": bool(backends),
+        "can_transcribe": bool(names),
         "recommendation": (
             "Install openai-whisper: pip install openai-whisper"
-            if not backends else f"Using: {backends[0]['name']}"
+            if not names else f"Using: {names[0]}"
         ),
     }
 
 
+def describe_backends(whisper_info: dict) -> dict:
+    """Expand check_whisper_skill() into the --check-whisper report."""
+    report = {"status": whisper_info["status"],
+              "backends": [{"name": name, "path": path, "available": True}
+                           for name, path in whisper_info["backend_paths"].items()]}
+    report.update((k, v) for k, v in whisper_info.items()
+                  if k not in ("status", "backend_names", "backend_paths"))
+    return report
+
+
+class WhisperDaemon:
+    """
+    Client for the persistent Whisper worker (voice_bridge_worker.py).
+    The worker is spawned on first use and keeps the model loaded between calls;
+    it exits by itself after a period of inactivity.
+    """
+
+    def __init__(self, socket_path: Path = WHISPER_SOCKET):
+        self.socket_path = socket_path
+
+    @staticmethod
+    def supported() -> bool:
+        return hasattr(socket, "AF_UNIX") and WHISPER_WORKER.exists()
+
+    def request(self, payload: dict, timeout: float = 180) -> dict:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(self.socket_path))
+            with sock.makefile("rwb") as stream:
+                stream.write(json.dumps(payload).encode() + b"\n")
+                stream.flush()
+                line = stream.readline()
+        if not line:
+            raise ConnectionError("Whisper worker closed the connection")
+        return json.loads(line)
+
+    def is_running(self) -> bool:
+        # A connect is enough: a worker busy loading the model or transcribing
+        # won't answer a ping promptly, but its socket still accepts.
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(2)
+                sock.connect(str(self.socket_path))
+            return True
+        except OSError:
+            return False
+
+    def ensure_running(self) -> bool:
+        """Start the worker if it isn't already listening. Returns True once it is."""
+        if not self.supported():
+            return False
+        if self.is_running():
+            return True
+        try:
+            subprocess.Popen([sys.executable, str(WHISPER_WORKER)],
+                             stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, start_new_session=True)
+        except OSError:
+            return False
+        deadline = time.monotonic() + WHISPER_STARTUP_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            if self.is_running():
+                return True
+        return False
+
+    def transcribe(self, path: str) -> dict:
+        if not self.ensure_running():
+            return {"status": "error", "message": "Whisper worker unavailable."}
+        try:
+            return self.request({"file": str(Path(path).resolve())})
+        except (OSError, ValueError) as e:
+            return {"status": "error", "message": f"Whisper worker failed: {e}"}
+
+    def transcribe_pcm(self, pcm: bytes, rate: int = STREAM_SAMPLE_RATE) -> dict:
+        try:
+            return self.request({"cmd": "transcribe_pcm", "rate": rate,
+                                 "pcm": base64.b64encode(pcm).decode("ascii")})
+        except (OSError, ValueError) as e:
+            return {"status": "error", "message": f"Whisper worker failed: {e}"}
+
+    def transcribe_batch(self, paths: list) -> dict:
+        if not self.ensure_running():
+            return {"status": "error", "message": "Whisper worker unavailable."}
+        try:
+            return self.request({"files": [str(Path(p).resolve()) for p in paths]},
+                                timeout=180 * max(1, len(paths)))
+        except (OSError, ValueError) as e:
+            return {"status": "error", "message": f"Whisper worker failed: {e}"}
+
+    def warm(self) -> bool:
+        """Start the worker and have it load the model now."""
+        if not self.ensure_running():
+            return False
+        try:
+            return self.request({"cmd": "warm"}, timeout=300).get("status") == "ok"
+        except (OSError, ValueError):
+            return False
+
+    def shutdown(self) -> dict:
+        if not self.supported() or not self.is_running():
+            return {"status": "ok", "message": "Whisper worker not running."}
+        try:
+            return self.request({"cmd": "shutdown"}, timeout=5)
+        except (OSError, ValueError) as e:
+            return {"status": "error", "message": str(e)}
+
+
+_whisper_daemon = WhisperDaemon()
+
+
+_WHISPER_SKILL_LOCK = threading.Lock()
+
+
+def _whisper_skill_module():
+    """
+    Import the whisper skill's transcribe.py once, under a private module name,
+    so a model it holds at module level survives between calls. None if it
+    can't be imported. Locked so the --record warm-up thread and
+    transcribe_audio never import (and load the model) twice.
+    """
+    with _WHISPER_SKILL_LOCK:
+        return _load_whisper_skill_module()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_whisper_skill_module():
+    script = WHISPER_SKILL_DIR / "scripts" / "transcribe.py"
+    try:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("_whisper_skill_transcribe", script)
+        module = importlib.util.module_from_spec(spec)
+        skill_scripts = str(script.parent)
+        if skill_scripts not in sys.path:
+            sys.path.append(skill_scripts)  # its own helpers; never shadows ours
+        # Keep our stdout pure JSON — but sys.stdout is process-wide, so only
+        # swap it on the main thread, never from the warm-up thread.
+        quiet = (contextlib.redirect_stdout(sys.stderr)
+                 if threading.current_thread() is threading.main_thread()
+                 else contextlib.nullcontext())
+        with quiet:
+            spec.loader.exec_module(module)
+        return module
+    except (Exception, SystemExit):  # a script that exits on import
+        return None
+
+
+def _transcribe_with_skill_module(path: str):
+    """Transcribe via the skill's transcribe_file(); None means use the subprocess path."""
+    transcribe_file = getattr(_whisper_skill_module(), "transcribe_file", None)
+    if not callable(transcribe_file):
+        return None
+    try:
+        with contextlib.redirect_stdout(sys.stderr):  # keep our stdout pure JSON
+            data = transcribe_file(path)
+    except Exception:
+        return None
+    if isinstance(data, dict):
+        return str(data.get("text", "")).strip()
+    return str(data).strip() if isinstance(data, str) else None
+
+
+def _warm_transcription_backend():
+    """Load the preferred backend's model ahead of time (run while recording)."""
+    try:
+        whisper_info = check_whisper_skill()
+        if whisper_info["preferred"] == "whisper_skill":
+            _whisper_skill_module()
+        elif "openai_whisper" in whisper_info["backend_names"]:
+            _whisper_daemon.warm()
+    except Exception:
+        pass
+
+
 def transcribe_audio(audio_path: str) -> dict:
     """Transcribe an audio file using the best available backend."""
     path = Path(audio_path)
@@ -155,21 +523,32 @@ def transcribe_audio(audio_path: str) -> dict:
 
     preferred = whisper_info["preferred"]
 
-    # Try OpenClaw whisper skill first
+    # Try OpenClaw whisper skill first: in-process (model stays loaded), then subprocess
     if preferred == "whisper_skill":
+        text = _transcribe_with_skill_module(str(path))
+        if text is not None:
+            return {"status": "ok", "text": text, "backend": "whisper_skill"}
         try:
             result = subprocess.run(
                 [sys.executable, str(WHISPER_SKILL_DIR / "scripts/transcribe.py"),
                  "--file", str(path)],
                 capture_output=True, text=True, timeout=120)
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                data = _loads(result.stdout)
                 return {"status": "ok", "text": data.get("text", ""), "backend": "whisper_skill"}
         except Exception as e:
             pass  # fall through to next backend
 
-    # Try openai-whisper Python package
-    if any(b["name"] == "openai_whisper" for b in whisper_info["backends"]):
+    # Try openai-whisper Python package: persistent worker first, then in-process
+    if "openai_whisper" in whisper_info["backend_names"]:
+        result_data = _whisper_daemon.transcribe(str(path))
+        if result_data.get("status") == "ok":
+            return {
+                "status": "ok",
+                "text": result_data.get("text", ""),
+                "backend": "openai_whisper",
+                "language": result_data.get("language", ""),
+            }
         try:
             import whisper as _whisper  # type: ignore
             model = _whisper.load_model("base")
@@ -184,7 +563,7 @@ def transcribe_audio(audio_path: str) -> dict:
             pass  # fall through
 
     # Try whisper CLI
-    if any(b["name"] == "whisper_cli" for b in whisper_info["backends"]):
+    if "whisper_cli" in whisper_info["backend_names"]:
         try:
             result = subprocess.run(
                 ["whisper", str(path), "--output_format", "json", "--output_dir", "/tmp"],
@@ -200,6 +579,42 @@ def transcribe_audio(audio_path: str) -> dict:
     return {"status": "error", "message": "All transcription backends failed."}
 
 
+def transcribe_audio_batch(audio_paths: list) -> dict:
+    """
+    Transcribe several audio files. With openai-whisper, all existing files go
+    to the persistent worker in one request; otherwise each file goes through
+    transcribe_audio(). Results are returned in input order.
+    """
+    results = [None] * len(audio_paths)
+    pending = []
+    for i, p in enumerate(audio_paths):
+        if Path(p).exists():
+            pending.append(i)
+        else:
+            results[i] = {"status": "error", "message": f"File not found: {p}"}
+
+    whisper_info = check_whisper_skill()
+    if (pending and whisper_info["preferred"] != "whisper_skill"
+            and "openai_whisper" in whisper_info["backend_names"]):
+        batch = _whisper_daemon.transcribe_batch([audio_paths[i] for i in pending])
+        if batch.get("status") == "ok":
+            for i, r in zip(pending, batch.get("results", [])):
+                if r.get("status") == "ok":
+                    results[i] = {"status": "ok", "text": r.get("text", ""),
+                                  "backend": "openai_whisper",
+                                  "language": r.get("language", "")}
+
+    for i in pending:
+        if results[i] is None:
+            results[i] = transcribe_audio(audio_paths[i])
+
+    return {
+        "status": "ok",
+        "results": [dict(r, file=p) for p, r in zip(audio_paths, results)],
+        "transcribed": sum(1 for r in results if r.get("status") == "ok"),
+    }
+
+
 def record_audio(seconds: int = 10) -> dict:
     """Record audio from the default microphone. Returns path to recorded file."""
     output_path = SKILL_DIR / "tmp_recording.wav"
@@ -208,9 +623,10 @@ def record_audio(seconds: int = 10) -> dict:
     if shutil.which("rec"):
         try:
             subprocess.run(
-                ["rec", "-r", "16000", "-c", "1", "-b", "16", str(output_path),
+                ["rec", "-q", "-r", "16000", "-c", "1", "-b", "16", str(output_path),
                  "trim", "0", str(seconds)],
-                check=True, timeout=seconds + 5)
+                check=True, timeout=seconds + 5,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return {"status": "ok", "path": str(output_path)}
         except Exception as e:
             pass
@@ -225,24 +641,33 @@ def record_audio(seconds: int = 10) -> dict:
             else:
                 input_device = "pulse"
                 input_arg = "default"
+            # Errors only on stderr: no banner or progress lines to buffer
             subprocess.run(
-                ["ffmpeg", "-y", "-f", input_device, "-i", input_arg,
+                ["ffmpeg", "-hide_banner", "-nostats", "-loglevel", "error", "-y",
+                 "-f", input_device, "-i", input_arg,
                  "-t", str(seconds), "-ar", "16000", "-ac", "1", str(output_path)],
-                check=True, timeout=seconds + 10, capture_output=True)
+                check=True, timeout=seconds + 10,
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             return {"status": "ok", "path": str(output_path)}
+        except subprocess.CalledProcessError as e:
+            detail = (e.stderr or b"").decode("utf-8", "replace").strip()[-500:]
+            return {"status": "error",
+                    "message": f"ffmpeg recording failed: {e}" + (f": {detail}" if detail else "")}
         except Exception as e:
             return {"status": "error", "message": f"ffmpeg recording failed: {e}"}
 
-    # Try Python sounddevice
+    # Try Python sounddevice (16 kHz mono int16, written with the stdlib wave module)
     try:
         import sounddevice as sd  # type: ignore
-        import scipy.io.wavfile as wav  # type: ignore
-        import numpy as np  # type: ignore
         sample_rate = 16000
         recording = sd.rec(int(seconds * sample_rate), samplerate=sample_rate,
-                           channels=1, dtype=np.int16)
+                           channels=1, dtype="int16")
         sd.wait()
-        wav.write(str(output_path), sample_rate, recording)
+        with wave.open(str(output_path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(sample_rate)
+            w.writeframes(recording.tobytes())
         return {"status": "ok", "path": str(output_path)}
     except ImportError:
         pass
@@ -272,6 +697,19 @@ def _looks_suspicious(text: str) -> bool:
     return False
 
 
+def _decode(output) -> str:
+    """Child output as text; undecodable bytes are replaced rather than raised."""
+    return output.decode("utf-8", "replace")
+
+
+def _fill_args(tokens: tuple, groups: dict) -> list:
+    # Each token becomes exactly one argument; captured text is never split.
+    return [groups.get(value, f"{{{value}}}") if kind == "ph"
+            else _fill_arg(value, groups) if kind == "fmt"
+            else value
+            for kind, value in tokens]
+
+
 def _fill_arg(template: str, groups: dict) -> str:
     # Fill placeholders like "{1}", "{2}", "{0}".
     out = template
@@ -280,6 +718,30 @@ def _fill_arg(template: str, groups: dict) -> str:
     return out
 
 
+def _match_intent(text_clean: str):
+    """Return (intent index, captured groups) of the first matching intent, or None."""
+    compiled, combined, spans, static = _routing_tables()
+    k = static.get(text_clean)
+    if k is not None:
+        return k, ()
+    return _match_intent_regex(text_clean, compiled, combined, spans)
+
+
+def _match_intent_regex(text_clean: str, compiled: list, combined, spans: list):
+    if combined is not None:
+        m = combined.match(text_clean)
+        if not m:
+            return None
+        k = int(m.lastgroup[1:])
+        wrapper, last = spans[k]
+        return k, m.groups()[wrapper:last]
+    for k, (cre, _, _, _) in enumerate(compiled):
+        m = cre.search(text_clean)
+        if m:
+            return k, m.groups()
+    return None
+
+
 def route_command(text: str) -> dict:
     """
     Match a transcribed command to a proactive-claw script and run it safely.
@@ -300,16 +762,16 @@ def route_command(text: str) -> dict:
         }
 
     text_clean = text_clean.lower()
-    text_clean = re.sub(r"[.,!?;]$", "", text_clean).strip()
+    text_clean = text_clean.rstrip(".,!?; \t")
 
-    for pattern, script_name, args_template in INTENTS:
-        m = re.search(pattern, text_clean, re.IGNORECASE)
-        if not m:
-            continue
+    match = _match_intent(text_clean)
+    if match is not None:
+        k, captured = match
+        _, pattern, script_name, args_tokens = _routing_tables()[0][k]
 
         # Build placeholder map: {0} full text, {1..N} groups
         groups = {"0": text_clean}
-        for i, g in enumerate(m.groups(), start=1):
+        for i, g in enumerate(captured, start=1):
             val = (g or "").strip()
             if not val:
                 val = "this week"
@@ -326,16 +788,17 @@ def route_command(text: str) -> dict:
         script_path = str(SKILL_DIR / "scripts" / script_name)
 
         # Fill args template WITHOUT ever splitting user text
-        filled_args = [_fill_arg(a, groups) for a in args_template]
+        filled_args = _fill_args(args_tokens, groups)
         cmd = [sys.executable, script_path] + filled_args
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # Raw bytes: parsed directly, decoded only if they aren't JSON
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
             if result.returncode == 0:
                 try:
-                    data = json.loads(result.stdout)
+                    data = _loads(result.stdout)
                 except Exception:
-                    data = {"raw_output": result.stdout.strip()}
+                    data = {"raw_output": _decode(result.stdout).strip()}
                 return {
                     "status": "ok",
                     "intent_matched": pattern,
@@ -347,7 +810,7 @@ def route_command(text: str) -> dict:
                 "status": "script_error",
                 "intent_matched": pattern,
                 "script": script_name,
-                "stderr": result.stderr.strip()[:500],
+                "stderr": _decode(result.stderr).strip()[:500],
             }
         except subprocess.TimeoutExpired:
             return {"status": "timeout", "script": script_name}
@@ -359,6 +822,89 @@ def route_command(text: str) -> dict:
         "message": f"Couldn't route: '{text}'. Try: 'move X to Y', 'show free time tomorrow', 'read calendar this week'.",
         "text": text,
     }
+
+
+def stream_and_route(max_seconds: int = 30) -> dict:
+    """
+    Record from the microphone and route as soon as the command is complete.
+    Audio is captured on sounddevice's callback thread; every
+    STREAM_CHUNK_SECONDS the last STREAM_WINDOW_SECONDS of it are sent to the
+    Whisper worker, so each partial costs the same however long the user talks.
+    The utterance ends after STREAM_SILENCE_SECONDS of quiet following speech,
+    or when two partials in a row come back identical (nothing new was said),
+    rather than after a fixed-length recording. Whisper punctuates almost every
+    partial, so a trailing full stop is not treated as the end. The whole
+    utterance is then transcribed once for routing.
+    """
+    whisper_info = check_whisper_skill()
+    if "openai_whisper" not in whisper_info["backend_names"]:
+        return {"status": "no_backend",
+                "message": "Streaming needs the openai-whisper package. "
+                           + whisper_info["recommendation"]}
+    try:
+        import sounddevice as sd  # type: ignore
+    except ImportError:
+        return {"status": "error", "message": "Streaming needs sounddevice: pip install sounddevice"}
+    if not _whisper_daemon.ensure_running():
+        return {"status": "error", "message": "Whisper worker unavailable."}
+
+    blocks: queue.Queue = queue.Queue()
+
+    def on_audio(indata, frames, time_info, status):
+        blocks.put((indata.tobytes(), int(abs(indata).max())))
+
+    rate = STREAM_SAMPLE_RATE
+    chunk_bytes = STREAM_CHUNK_SECONDS * rate * 2
+    window_bytes = STREAM_WINDOW_SECONDS * rate * 2
+    silence_limit = STREAM_SILENCE_SECONDS * rate
+    buffer = bytearray()
+    transcribed_upto = quiet_samples = partials = 0
+    heard_speech = False
+    text = ""  # latest partial
+    deadline = time.monotonic() + max_seconds
+    try:
+        with sd.InputStream(samplerate=rate, channels=1, dtype="int16", callback=on_audio):
+            _whisper_daemon.warm()
+            while time.monotonic() < deadline:
+                try:
+                    data, peak = blocks.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                buffer += data
+                if peak < STREAM_SILENCE_PEAK:
+                    quiet_samples += len(data) // 2
+                else:
+                    quiet_samples, heard_speech = 0, True
+                if heard_speech and quiet_samples >= silence_limit:
+                    break
+                if len(buffer) - transcribed_upto >= chunk_bytes:
+                    transcribed_upto = len(buffer)
+                    partial = _whisper_daemon.transcribe_pcm(bytes(buffer[-window_bytes:]), rate)
+                    partials += 1
+                    if partial.get("status") == "ok":
+                        previous, text = text, partial.get("text", "")
+                        if heard_speech and text and text == previous:
+                            break  # transcript stopped changing
+    except Exception as e:
+        return {"status": "error", "message": f"Streaming failed: {e}"}
+
+    if not heard_speech:
+        return {"status": "empty", "message": "No speech detected."}
+    # The last partial already covers the utterance if nothing came after it
+    # and it fit in the window; otherwise transcribe the whole buffer once.
+    if transcribed_upto < len(buffer) or len(buffer) > window_bytes or not text:
+        final = _whisper_daemon.transcribe_pcm(bytes(buffer), rate)
+        if final.get("status") != "ok":
+            return final
+        text = final.get("text", "")
+    if not text:
+        return {"status": "empty", "message": "Transcription returned empty text."}
+    routing = route_command(text)
+    routing["transcription"] = text
+    routing["partials"] = partials
+    return routing
+
+
 def transcribe_and_route(audio_path: str) -> dict:
     """Full pipeline: transcribe audio then route command."""
     transcription = transcribe_audio(audio_path)
@@ -376,28 +922,49 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--transcribe", metavar="AUDIO_FILE",
                         help="Transcribe an audio file")
+    parser.add_argument("--transcribe-batch", metavar="AUDIO_FILE", nargs="+",
+                        help="Transcribe several audio files in one pass")
     parser.add_argument("--route", metavar="TEXT",
                         help="Route a text command to the appropriate script")
     parser.add_argument("--record", action="store_true",
                         help="Record from microphone then transcribe and route")
+    parser.add_argument("--stream", action="store_true",
+                        help="Record, transcribing as you speak, and route when the command ends")
     parser.add_argument("--seconds", type=int, default=10,
-                        help="Recording length for --record (default 10)")
+                        help="Recording length for --record, or the maximum for --stream (default 10)")
     parser.add_argument("--check-whisper", action="store_true",
                         help="Check available transcription backends")
+    parser.add_argument("--shutdown-whisper", action="store_true",
+                        help="Stop the persistent Whisper worker")
+    parser.add_argument("--refresh-backends", action="store_true",
+                        help="Re-probe transcription backends before running")
     args = parser.parse_args()
 
+    if args.refresh_backends:
+        check_whisper_skill.cache_clear()
+
     if args.check_whisper:
-        print(json.dumps(check_whisper_skill(), indent=2))
+        print(json.dumps(describe_backends(check_whisper_skill()), indent=2))
+    elif args.shutdown_whisper:
+        print(json.dumps(_whisper_daemon.shutdown(), indent=2))
     elif args.transcribe:
         print(json.dumps(transcribe_audio(args.transcribe), indent=2))
+    elif args.transcribe_batch:
+        print(json.dumps(transcribe_audio_batch(args.transcribe_batch), indent=2))
     elif args.route:
         print(json.dumps(route_command(args.route), indent=2))
     elif args.record:
+        # Load the model while the microphone is recording, not after
+        threading.Thread(target=_warm_transcription_backend, daemon=True).start()
         rec = record_audio(args.seconds)
         if rec.get("status") != "ok":
             print(json.dumps(rec, indent=2))
         else:
             print(json.dumps(transcribe_and_route(rec["path"]), indent=2))
+    elif args.stream:
+        print(json.dumps(stream_and_route(args.seconds), indent=2))
+    elif args.refresh_backends:
+        print(json.dumps(describe_backends(check_whisper_skill()), indent=2))
     else:
         parser.print_help()
 
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+voice_bridge_worker.py — Persistent Whisper worker for voice_bridge.py.
+
+Loads the openai-whisper model once and serves transcription requests over a
+Unix socket, so repeated voice commands don't pay the model load each time.
+Started on demand by voice_bridge.py; exits after IDLE_TIMEOUT_SECONDS without
+requests, or when asked to shut down. The PID file is held under an exclusive
+lock, so if two callers spawn a worker at once the second one exits instead of
+taking over the socket.
+
+Protocol: one JSON object per line in, one JSON object per line out.
+  {"cmd": "ping"}                   → {"status": "ok", "pid": ...}
+  {"cmd": "warm"}                   → load the model now
+  {"file": "/path/to/audio.wav"}    → {"status": "ok", "text": ..., "language": ...}
+  {"files": [path, ...]}            → {"status": "ok", "results": [one result per file]}
+  {"cmd": "transcribe_pcm", "pcm": base64 16 kHz mono int16}  → as for "file"
+  {"cmd": "shutdown"}               → stop serving
+
+Usage:
+  python3 voice_bridge_worker.py    # normally spawned by voice_bridge.py
+"""
+
+import atexit
+import base64
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+SKILL_DIR = Path.home() / ".openclaw/workspace/skills/proactive-claw"
+SOCKET_FILE = SKILL_DIR / "whisper.sock"
+PID_FILE = SKILL_DIR / "tmp_whisper.pid"
+MODEL_NAME = "base"
+IDLE_TIMEOUT_SECONDS = 900
+
+_MODEL = None
+
+
+def _get_model():
+    global _MODEL
+    if _MODEL is None:
+        import whisper  # type: ignore
+        _MODEL = whisper.load_model(MODEL_NAME)
+    return _MODEL
+
+
+def _transcribe(path: str) -> dict:
+    result = _get_model().transcribe(path)
+    return {
+        "status": "ok",
+        "text": result.get("text", "").strip(),
+        "language": result.get("language", ""),
+    }
+
+
+def _transcribe_pcm(pcm_b64: str, rate: int) -> dict:
+    """Transcribe raw 16 kHz mono int16 audio (a rolling buffer from --stream)."""
+    if rate != 16000:
+        return {"status": "error", "message": f"Unsupported sample rate: {rate}"}
+    import numpy as np  # type: ignore  # installed with openai-whisper
+    audio = np.frombuffer(base64.b64decode(pcm_b64), dtype=np.int16).astype(np.float32) / 32768.0
+    result = _get_model().transcribe(audio, condition_on_previous_text=False)
+    return {
+        "status": "ok",
+        "text": result.get("text", "").strip(),
+        "language": result.get("language", ""),
+    }
+
+
+def _transcribe_batch(paths: list) -> dict:
+    """
+    Transcribe several files in one round trip, smallest first (size as a cheap
+    proxy for duration). Results come back in request order; one bad file
+    doesn't fail the batch.
+    """
+    results = [None] * len(paths)
+    for i in sorted(range(len(paths)), key=lambda i: _file_size(paths[i])):
+        try:
+            results[i] = _transcribe(str(paths[i]))
+        except Exception as e:
+            results[i] = {"status": "error", "message": str(e)}
+    return {"status": "ok", "results": results}
+
+
+def _file_size(path) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def handle_request(req: dict) -> dict:
+    cmd = req.get("cmd", "transcribe")
+    if cmd == "ping":
+        return {"status": "ok", "pid": os.getpid(), "model_loaded": _MODEL is not None}
+    if cmd == "warm":
+        _get_model()
+        return {"status": "ok"}
+    if cmd == "shutdown":
+        return {"status": "ok", "message": "shutting down"}
+    if cmd == "transcribe_pcm":
+        return _transcribe_pcm(req.get("pcm", ""), int(req.get("rate", 16000)))
+    if cmd == "transcribe" and req.get("file"):
+        return _transcribe(str(req["file"]))
+    if cmd == "transcribe" and isinstance(req.get("files"), list):
+        return _transcribe_batch(req["files"])
+    return {"status": "error", "message": f"Unknown request: {cmd}"}
+
+
+def _cleanup():
+    try:
+        if PID_FILE.read_text().strip() == str(os.getpid()):
+            PID_FILE.unlink()
+            SOCKET_FILE.unlink()
+    except Exception:
+        pass
+
+
+def _claim_pid_file():
+    """Lock PID_FILE and write our PID to it; None if another worker holds it."""
+    import fcntl
+    fd = os.open(PID_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    return fd  # kept open: the lock lasts as long as this process
+
+
+def _serve_connection(conn: socket.socket) -> dict:
+    """Answer one request on an accepted connection; returns the request."""
+    req = {}
+    try:
+        conn.settimeout(30)  # bounds socket I/O only, not the transcription
+        with conn, conn.makefile("rwb") as stream:
+            line = stream.readline()
+            if not line:
+                return req  # liveness probe: client connected and hung up
+            try:
+                req = json.loads(line)
+                if not isinstance(req, dict):
+                    req = {}
+                    raise ValueError("request must be a JSON object")
+                resp = handle_request(req)
+            except Exception as e:
+                resp = {"status": "error", "message": str(e)}
+            stream.write(json.dumps(resp).encode() + b"\n")
+            stream.flush()
+    except OSError:
+        pass  # client went away; nothing to report to
+    return req
+
+
+def serve():
+    SKILL_DIR.mkdir(parents=True, exist_ok=True)
+    os.umask(0o077)  # socket and pid file readable by this user only
+    if _claim_pid_file() is None:
+        return  # another worker is serving or starting up; leave its socket alone
+    try:
+        SOCKET_FILE.unlink()  # stale: the worker that made it no longer holds the lock
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(SOCKET_FILE))
+    server.listen(4)
+    server.settimeout(IDLE_TIMEOUT_SECONDS)
+    atexit.register(_cleanup)
+
+    with server:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            req = _serve_connection(conn)
+            if req.get("cmd") == "shutdown":
+                break
+
+
+if __name__ == "__main__":
+    if not hasattr(socket, "AF_UNIX"):
+        print(json.dumps({"status": "error", "message": "Unix sockets not supported."}))
+        sys.exit(1)
+    serve()